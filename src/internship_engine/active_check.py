@@ -2,7 +2,9 @@
 
 Strategy
 --------
-1. GET the URL (follow redirects, short timeout).
+1. HEAD the URL; a 404/410 is returned without a body, and a HEAD that
+   times out or fails returns UNKNOWN.  Otherwise GET it (streamed,
+   follow redirects, short timeout) and judge that response.
 2. HTTP 404/410          → INACTIVE
 3. HTTP 403/429          → UNKNOWN  (blocked, not conclusive)
 4. HTTP ≥500             → UNKNOWN  (server error)
@@ -16,7 +18,11 @@ Timeout / connection errors return UNKNOWN to avoid false positives.
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from typing import AnyStr
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 
@@ -52,11 +58,54 @@ _APPLY_SIGNALS: tuple[str, ...] = (
     'type="submit"',
 )
 
-# HTTP status codes that unambiguously mean "gone"
-_GONE_CODES: frozenset[int] = frozenset({404, 410})
 
-# HTTP status codes that are blocked/rate-limited (inconclusive)
-_BLOCKED_CODES: frozenset[int] = frozenset({401, 403, 429})
+def _alternation(signals: tuple[str, ...]) -> str:
+    """Return a regex alternation with one capture group per signal."""
+    return "|".join(f"({re.escape(sig)})" for sig in signals)
+
+
+# Each signal table compiled into one alternation so a page body is scanned
+# once per table (in C) instead of once per signal.  ``search`` returns the
+# leftmost hit (ties at one position go to the earlier table entry) and
+# ``match.lastindex - 1`` indexes the signal table.  The
+# signals are ASCII, so the ``bytes`` twins let streamed bodies be scanned
+# without decoding them first.
+_CLOSED_RE: re.Pattern[str] = re.compile(_alternation(_CLOSED_SIGNALS))
+_APPLY_RE: re.Pattern[str] = re.compile(_alternation(_APPLY_SIGNALS))
+_CLOSED_RE_BYTES: re.Pattern[bytes] = re.compile(
+    _alternation(_CLOSED_SIGNALS).encode("ascii")
+)
+_APPLY_RE_BYTES: re.Pattern[bytes] = re.compile(
+    _alternation(_APPLY_SIGNALS).encode("ascii")
+)
+
+# Page bodies are lower-cased and scanned in chunks of this many characters
+# (bytes, for streamed responses).
+_CHUNK_SIZE = 16384
+
+# Characters carried over between chunks so a signal that straddles a chunk
+# boundary is still found (longest signal length minus one).
+_OVERLAP = max(len(sig) for sig in _CLOSED_SIGNALS + _APPLY_SIGNALS) - 1
+
+# Verdicts decided by the status code alone: 404/410 unambiguously mean
+# "gone"; 401/403/429 are blocked / rate-limited (inconclusive).  5xx is
+# handled as a range check.
+_STATUS_VERDICTS: dict[int, tuple[ActiveStatus, str]] = {
+    404: (ActiveStatus.INACTIVE, "HTTP 404"),
+    410: (ActiveStatus.INACTIVE, "HTTP 410"),
+    401: (ActiveStatus.UNKNOWN, "HTTP 401 — page blocked"),
+    403: (ActiveStatus.UNKNOWN, "HTTP 403 — page blocked"),
+    429: (ActiveStatus.UNKNOWN, "HTTP 429 — page blocked"),
+}
+
+# Statuses a HEAD response may settle on its own.  Anything else is judged
+# from the GET: sites commonly answer HEAD with 403/405/5xx while serving
+# the page itself just fine.
+_HEAD_CONCLUSIVE: frozenset[int] = frozenset({404, 410})
+
+
+# Query parameters that only track the referral and never change the page
+_TRACKING_PARAMS: frozenset[str] = frozenset({"gclid", "fbclid", "msclkid", "gh_src"})
 
 
 # ---------------------------------------------------------------------------
@@ -106,13 +155,9 @@ def check_active_from_response(
     html:
         Raw response body text (used for closed-signal scanning on HTTP 200).
     """
-    if status_code in _GONE_CODES:
-        return ActiveCheckResult(ActiveStatus.INACTIVE, f"HTTP {status_code}")
-
-    if status_code in _BLOCKED_CODES:
-        return ActiveCheckResult(
-            ActiveStatus.UNKNOWN, f"HTTP {status_code} — page blocked"
-        )
+    verdict = _STATUS_VERDICTS.get(status_code)
+    if verdict is not None:
+        return ActiveCheckResult(*verdict)
 
     if status_code >= 500:
         return ActiveCheckResult(
@@ -120,22 +165,7 @@ def check_active_from_response(
         )
 
     if status_code == 200:
-        html_lower = html.lower()
-        for signal in _CLOSED_SIGNALS:
-            if signal in html_lower:
-                return ActiveCheckResult(
-                    ActiveStatus.INACTIVE,
-                    f"closed signal: '{signal}'",
-                )
-
-        # Apply heuristic: note it in the reason, but don't block on absence
-        has_apply = any(sig in html_lower for sig in _APPLY_SIGNALS)
-        reason = (
-            "apply button detected"
-            if has_apply
-            else "no closed signals found"
-        )
-        return ActiveCheckResult(ActiveStatus.ACTIVE, reason)
+        return _scan_body(_iter_chunks(html), _CLOSED_RE, _APPLY_RE)
 
     # Unexpected 2xx/3xx after redirect, or status_code == 0
     return ActiveCheckResult(ActiveStatus.UNKNOWN, f"HTTP {status_code}")
@@ -160,7 +190,9 @@ def check_active(
         The posting URL to check.
     session:
         Optional pre-configured ``requests.Session``.  A fresh session is
-        created if not provided.  Pass a mock session in tests.
+        created if not provided; pipeline callers should pass the
+        extractor's session so connections to the same host are reused.
+        Pass a mock session in tests.
     timeout:
         Request timeout in seconds (default 8).
 
@@ -170,8 +202,25 @@ def check_active(
         Never raises; all exceptions are caught and mapped to UNKNOWN.
     """
     s = session or requests.Session()
+
+    # HEAD first: a gone posting needs no body at all.  Every other status
+    # falls through to a streamed GET, since blocked / error answers to HEAD
+    # say little about the page.  A HEAD that fails outright is UNKNOWN:
+    # callers check URLs whose fetch already failed, so retrying with a GET
+    # would usually just wait out a second timeout.
+    try:
+        head = s.head(url, timeout=timeout, allow_redirects=True)
+    except requests.exceptions.Timeout:
+        logger.debug("active_check: HEAD timeout for %s", url)
+        return ActiveCheckResult(ActiveStatus.UNKNOWN, "request timed out")
+    except requests.exceptions.RequestException as exc:
+        logger.debug("active_check: HEAD failed for %s: %s", url, exc)
+        return ActiveCheckResult(ActiveStatus.UNKNOWN, f"request failed: {exc}")
+    if head.status_code in _HEAD_CONCLUSIVE:
+        return check_active_from_response(head.status_code)
+
     try:
-        resp = s.get(url, timeout=timeout, allow_redirects=True)
+        resp = s.get(url, timeout=timeout, allow_redirects=True, stream=True)
     except requests.exceptions.Timeout:
         logger.debug("active_check: timeout for %s", url)
         return ActiveCheckResult(ActiveStatus.UNKNOWN, "request timed out")
@@ -179,4 +228,91 @@ def check_active(
         logger.debug("active_check: request failed for %s: %s", url, exc)
         return ActiveCheckResult(ActiveStatus.UNKNOWN, f"request failed: {exc}")
 
-    return check_active_from_response(resp.status_code, resp.text)
+    # The raw body is streamed so scanning can stop at the first closed
+    # signal and no charset detection / decoding is needed; closing the
+    # response hands the connection back to the session pool.
+    try:
+        if resp.status_code != 200:
+            return check_active_from_response(resp.status_code)
+        return _scan_body(
+            resp.iter_content(chunk_size=_CHUNK_SIZE),
+            _CLOSED_RE_BYTES,
+            _APPLY_RE_BYTES,
+        )
+    except requests.exceptions.RequestException as exc:
+        logger.debug("active_check: body read failed for %s: %s", url, exc)
+        return ActiveCheckResult(ActiveStatus.UNKNOWN, f"request failed: {exc}")
+    finally:
+        resp.close()
+
+
+def canonical_url(url: str) -> str:
+    """Return *url* normalised for use as an active-check cache key.
+
+    Lower-cases the scheme and host, drops the fragment, and removes
+    ``utm_*`` and other referral-tracking query parameters, so two links
+    to the same posting map to the same key.
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            urlencode(query),
+            "",
+        )
+    )
+
+
+# ---------------------------------------------------------------------------
+# Body scanning helpers
+# ---------------------------------------------------------------------------
+
+
+def _iter_chunks(html: str) -> Iterator[str]:
+    """Yield *html* in ``_CHUNK_SIZE`` slices."""
+    for start in range(0, len(html), _CHUNK_SIZE):
+        yield html[start : start + _CHUNK_SIZE]
+
+
+def _scan_body(
+    chunks: Iterable[AnyStr],
+    closed_re: re.Pattern[AnyStr],
+    apply_re: re.Pattern[AnyStr],
+) -> ActiveCheckResult:
+    """Return the verdict for an HTTP 200 body supplied as *chunks*.
+
+    Each chunk is lower-cased on its own (prefixed with the tail of the
+    previous one), so the full lower-cased body is never materialised and
+    the scan stops as soon as a closed signal is seen.  *chunks* may be
+    ``str`` or ``bytes`` as long as the patterns match that type.
+
+    When a page contains several closed signals, the reason names the one
+    that appears **first in the body**, not the first in
+    :data:`_CLOSED_SIGNALS`: the scan stops at the leftmost hit.  Signals
+    starting at the same offset resolve in table order.
+    """
+    has_apply = False
+    tail: AnyStr | None = None
+    for chunk in chunks:
+        window = chunk.lower() if tail is None else tail + chunk.lower()
+        closed = closed_re.search(window)
+        if closed is not None:
+            signal = _CLOSED_SIGNALS[closed.lastindex - 1]
+            return ActiveCheckResult(
+                ActiveStatus.INACTIVE,
+                f"closed signal: '{signal}'",
+            )
+        if not has_apply:
+            has_apply = apply_re.search(window) is not None
+        tail = window[-_OVERLAP:]
+
+    # Apply heuristic: note it in the reason, but don't block on absence
+    reason = "apply button detected" if has_apply else "no closed signals found"
+    return ActiveCheckResult(ActiveStatus.ACTIVE, reason)
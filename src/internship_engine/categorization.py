@@ -4,13 +4,22 @@ The categorizer performs a greedy, ordered scan of ``_CATEGORY_KEYWORDS``.
 The first category whose keyword list contains a match (substring, case-
 insensitive) against the combined title + description wins.  This keeps
 the logic deterministic and easy to extend.
+
+Keywords are compiled into per-category matchers at import time.  The
+text is tokenised once; plain single-word keywords are then tested by set
+intersection with its words, so their number does not affect the cost.
 """
 
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from internship_engine.models import Category
 
-from internship_engine.models import Category, JobPosting
+if TYPE_CHECKING:
+    from internship_engine.models import JobPosting
 
 # ---------------------------------------------------------------------------
 # Keyword registry
@@ -18,8 +27,8 @@ from internship_engine.models import Category, JobPosting
 # Keys are tried in insertion order (Python 3.7+), so place more-specific
 # categories before generic ones to get the most precise label.
 
-_CATEGORY_KEYWORDS: dict[Category, list[str]] = {
-    Category.DATA: [
+_CATEGORY_KEYWORDS: dict[Category, tuple[str, ...]] = {
+    Category.DATA: (
         "data science",
         "machine learning",
         "deep learning",
@@ -33,14 +42,14 @@ _CATEGORY_KEYWORDS: dict[Category, list[str]] = {
         "data analyst",
         "analytics",
         "data",
-    ],
-    Category.PRODUCT: [
+    ),
+    Category.PRODUCT: (
         "product manager",
         "product management",
         "product owner",
         "program manager",
-    ],
-    Category.DESIGN: [
+    ),
+    Category.DESIGN: (
         "user experience",
         "user interface",
         "ux researcher",
@@ -49,8 +58,8 @@ _CATEGORY_KEYWORDS: dict[Category, list[str]] = {
         "graphic designer",
         "visual designer",
         "design",
-    ],
-    Category.FINANCE: [
+    ),
+    Category.FINANCE: (
         "quantitative",
         "investment banking",
         "financial analyst",
@@ -58,8 +67,8 @@ _CATEGORY_KEYWORDS: dict[Category, list[str]] = {
         "finance",
         "trading",
         "quant",
-    ],
-    Category.MARKETING: [
+    ),
+    Category.MARKETING: (
         "digital marketing",
         "content marketing",
         "growth marketing",
@@ -67,10 +76,10 @@ _CATEGORY_KEYWORDS: dict[Category, list[str]] = {
         "copywriting",
         "social media",
         "marketing",
-    ],
+    ),
     # SOFTWARE is intentionally last so that DATA / PRODUCT / DESIGN roles
     # that mention "engineer" are not misclassified.
-    Category.SOFTWARE: [
+    Category.SOFTWARE: (
         "software engineer",
         "software developer",
         "backend",
@@ -90,12 +99,12 @@ _CATEGORY_KEYWORDS: dict[Category, list[str]] = {
         "web developer",
         "api developer",
         "infrastructure engineer",
-    ],
+    ),
 }
 
 
-def _kw_match(keyword: str, text: str) -> bool:
-    """Check whether *keyword* appears in *text* as a meaningful match.
+def _kw_pattern(keyword: str) -> str:
+    """Return the regex source that matches *keyword* meaningfully.
 
     * Single-word keywords use ``\\b`` word-boundary anchors so that e.g.
       ``"data"`` does **not** match inside ``"candidate"``.
@@ -103,22 +112,70 @@ def _kw_match(keyword: str, text: str) -> bool:
       which is already precise enough.
     """
     if " " in keyword:
-        return keyword in text
-    return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
+        return re.escape(keyword)
+    return rf"\b{re.escape(keyword)}\b"
+
+
+_WORD_RE = re.compile(r"\w+")
+_PLAIN_WORD_RE = re.compile(r"\w+\Z")
+
+
+@dataclass(frozen=True)
+class _CategoryMatcher:
+    """The keywords of one category, compiled for :meth:`matches`.
+
+    A single-word keyword made only of word characters matches between
+    ``\\b`` anchors exactly when it equals one of the text's ``\\w+`` runs,
+    so those are held in :attr:`words` and tested by set intersection.
+    Phrases are plain substrings; the few remaining keywords (hyphenated
+    words) keep their :func:`_kw_pattern` regex in :attr:`pattern`.
+    """
+
+    category: Category
+    words: frozenset[str]
+    phrases: tuple[str, ...]
+    pattern: re.Pattern[str] | None
+
+    @classmethod
+    def of(cls, category: Category, keywords: tuple[str, ...]) -> _CategoryMatcher:
+        words = frozenset(kw for kw in keywords if _PLAIN_WORD_RE.match(kw))
+        phrases = tuple(kw for kw in keywords if " " in kw)
+        rest = [
+            _kw_pattern(kw) for kw in keywords if kw not in words and kw not in phrases
+        ]
+        return cls(
+            category=category,
+            words=words,
+            phrases=phrases,
+            pattern=re.compile("|".join(rest)) if rest else None,
+        )
+
+    def matches(self, text: str, words: set[str]) -> bool:
+        """Return True when any keyword occurs in *text*, whose words are *words*."""
+        if not self.words.isdisjoint(words):
+            return True
+        if any(phrase in text for phrase in self.phrases):
+            return True
+        return self.pattern is not None and self.pattern.search(text) is not None
+
+
+# Matchers in priority order (SOFTWARE last; the first match wins).
+_CATEGORY_MATCHERS: tuple[_CategoryMatcher, ...] = tuple(
+    _CategoryMatcher.of(category, keywords)
+    for category, keywords in _CATEGORY_KEYWORDS.items()
+)
 
 
 def categorize(posting: JobPosting) -> Category:
     """Return the best-matching :class:`Category` for *posting*.
 
     Matching is performed on the lower-cased concatenation of
-    ``title`` and ``description``.  Returns :attr:`Category.OTHER`
-    when no keyword matches.
+    ``title`` and ``description``, which is tokenised once.  Returns
+    :attr:`Category.OTHER` when no keyword matches.
     """
-    haystack = f"{posting.title} {posting.description}".lower()
-
-    for category, keywords in _CATEGORY_KEYWORDS.items():
-        for kw in keywords:
-            if _kw_match(kw, haystack):
-                return category
-
+    text = posting.search_text
+    words = set(_WORD_RE.findall(text))
+    for matcher in _CATEGORY_MATCHERS:
+        if matcher.matches(text, words):
+            return matcher.category
     return Category.OTHER
@@ -27,6 +27,10 @@ from datetime import date, timedelta
 
 from internship_engine import __version__
 
+# Concurrent page fetches / active-checks during ``run`` (I/O-bound; all
+# workers share the extractor's keep-alive session pool)
+_FETCH_WORKERS = 8
+
 # ---------------------------------------------------------------------------
 # Parser construction
 # ---------------------------------------------------------------------------
@@ -213,8 +217,12 @@ def build_parser() -> argparse.ArgumentParser:
 def cmd_run(args: argparse.Namespace) -> int:
     """Fetch → extract → filter → deduplicate → track → active-check → print."""
     # Lazy imports keep startup fast when other subcommands are used
+    from concurrent.futures import Future, ThreadPoolExecutor
+
     from internship_engine.active_check import (
+        ActiveCheckResult,
         ActiveStatus,
+        canonical_url,
         check_active,
         check_active_from_response,
     )
@@ -222,18 +230,13 @@ def cmd_run(args: argparse.Namespace) -> int:
     from internship_engine.config import get_settings
     from internship_engine.deduplication import (
         DuplicateFilter,
+        append_hashes,
         load_hashes,
-        save_hashes,
     )
     from internship_engine.extractor import Extractor, FetchResult
     from internship_engine.location_filter import LocationFilter
     from internship_engine.models import DatePostedConfidence, JobPosting
-    from internship_engine.tracks import (
-        Track,
-        filter_by_track,
-        track_match_label,
-        track_query_terms,
-    )
+    from internship_engine.tracks import Track, classify, track_query_terms
 
     settings = get_settings()
 
@@ -247,17 +250,31 @@ def cmd_run(args: argparse.Namespace) -> int:
     effective_keywords = args.keywords or track_query_terms(track_enum)
 
     # ── Resolve ATS targeting ─────────────────────────────────────────────
-    from internship_engine.sources.google_search import ATS_DOMAINS
+    from internship_engine.sources.google_search import (
+        ATS_DOMAINS,
+        load_productivity,
+        save_productivity,
+        update_productivity,
+    )
 
     ats = None if args.no_ats else ATS_DOMAINS
 
-    # ── Fetch raw search results ──────────────────────────────────────────
+    # ── Fetch raw search results (most productive queries first) ──────────
+    productivity = load_productivity(settings.query_stats_path)
+    query_hits: dict[str, int] = {}
     raw_results = source.fetch(
         locations=args.locations,
         keywords=effective_keywords,
         categories=args.categories,
         ats_domains=ats,
+        productivity=productivity,
+        query_hits=query_hits,
     )
+    if query_hits:
+        save_productivity(
+            settings.query_stats_path,
+            update_productivity(productivity, query_hits),
+        )
 
     if not raw_results:
         print("No search results returned. Check your API credentials and query.")
@@ -277,84 +294,109 @@ def cmd_run(args: argparse.Namespace) -> int:
         else None
     )
 
+    # Category enum values are lower-case; normalise so --category Software works
+    wanted_categories: frozenset[str] = frozenset(
+        c.strip().lower() for c in args.categories
+    )
+
     postings: list[JobPosting] = []
     fetch_results: dict[str, FetchResult] = {}  # keyed by posting_url
 
-    for result in raw_results:
-        ext = extractor.fetch_and_extract(result.url)
-
-        # Stash fetch metadata for later active-check reuse
-        if ext.fetch_result is not None:
-            fetch_results[result.url] = ext.fetch_result
-
-        # Build JobPosting — fall back to search snippet when extraction failed
-        posting = _make_posting(result, ext, source_name)
-
-        # ── Date filter (only when confidence is EXACT) ───────────────────
-        if (
-            cutoff is not None
-            and posting.date_posted_confidence == DatePostedConfidence.EXACT
-            and posting.date_posted is not None
-            and posting.date_posted < cutoff
-        ):
-            continue
-
-        # ── Location filter (skip when location is unknown — blocked or
-        #    empty extraction where we fell back to "Unknown") ──────────
-        location_unknown = ext.blocked or posting.location == "Unknown"
-        if not location_unknown and not loc_filter.matches(posting):
-            continue
+    # Fetch pages concurrently; the filter chain below consumes results in
+    # search order on this thread, so DuplicateFilter needs no locking.
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        extractions = pool.map(
+            extractor.fetch_and_extract, [r.url for r in raw_results]
+        )
+        for result, ext in zip(raw_results, extractions):
+            # Stash fetch metadata for later active-check reuse
+            if ext.fetch_result is not None:
+                fetch_results[result.url] = ext.fetch_result
+
+            # Build JobPosting — fall back to search snippet when extraction failed
+            posting = _make_posting(result, ext, source_name)
+
+            # ── Date filter (only when confidence is EXACT) ───────────────
+            if (
+                cutoff is not None
+                and posting.date_posted_confidence == DatePostedConfidence.EXACT
+                and posting.date_posted is not None
+                and posting.date_posted < cutoff
+            ):
+                continue
 
-        # ── Deduplication ─────────────────────────────────────────────────
-        if not dup_filter.is_new(posting):
-            continue
+            # ── Location filter (skip when location is unknown — blocked or
+            #    empty extraction where we fell back to "Unknown") ──────
+            location_unknown = ext.blocked or posting.location == "Unknown"
+            if not location_unknown and not loc_filter.matches(posting):
+                continue
 
-        # ── Categorisation ────────────────────────────────────────────────
-        category = categorize(posting)
-        posting = posting.model_copy(update={"category": category})
+            # ── Deduplication ─────────────────────────────────────────────
+            if not dup_filter.is_new(posting):
+                continue
 
-        # ── Category filter ───────────────────────────────────────────────
-        if args.categories and category.value not in args.categories:
-            continue
+            # ── Categorisation ────────────────────────────────────────────
+            category = categorize(posting)
 
-        # ── Track labelling (always) ──────────────────────────────────────
-        label = track_match_label(posting)
-        posting = posting.model_copy(update={"track_match": label})
+            # ── Category filter ───────────────────────────────────────────
+            if wanted_categories and category.value not in wanted_categories:
+                continue
 
-        postings.append(posting)
+            # ── Track labelling (always) and track filter, one scoring ────
+            matched, label = classify(posting)
+            if track_enum != Track.ALL and track_enum not in matched:
+                continue
 
-    # ── Track filter (post-loop, single pass) ─────────────────────────────
-    postings = filter_by_track(postings, track_enum)
+            # One copy carries both derived fields (and the cached text)
+            postings.append(
+                posting.model_copy(update={"category": category, "track_match": label})
+            )
 
     # ── Active-check (optional, capped at --active-check-max) ────────────
     if args.only_active and postings:
         limit = min(args.active_check_max, len(postings))
         checked: list[JobPosting] = []
 
-        for posting in postings[:limit]:
-            fr = fetch_results.get(posting.posting_url)
-            if fr is not None and not fr.error:
-                result = check_active_from_response(fr.status_code, fr.html)
-            else:
-                result = check_active(posting.posting_url)
-            posting = posting.model_copy(
-                update={
-                    "active_status": result.status,
-                    "active_reason": result.reason,
-                }
-            )
-            if result.status == ActiveStatus.INACTIVE:
-                continue
-            if result.status == ActiveStatus.UNKNOWN and args.drop_unknown_active:
-                continue
-            checked.append(posting)
+        with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+            # Reuse the extraction fetch when it produced a response; that
+            # verdict is a cheap body scan, done right here.  Only pages
+            # whose first fetch failed outright go to the pool, and only
+            # once per canonical URL — postings sharing one wait on the
+            # same future instead of racing each other to the network.
+            network: dict[str, Future[ActiveCheckResult]] = {}
+            verdicts: list[ActiveCheckResult | Future[ActiveCheckResult]] = []
+            for posting in postings[:limit]:
+                fr = fetch_results.get(posting.posting_url)
+                if fr is not None and not fr.error:
+                    verdicts.append(check_active_from_response(fr.status_code, fr.html))
+                    continue
+                key = canonical_url(posting.posting_url)
+                if key not in network:
+                    network[key] = pool.submit(
+                        check_active, posting.posting_url, session=extractor.session
+                    )
+                verdicts.append(network[key])
+
+            for posting, verdict in zip(postings[:limit], verdicts):
+                result = verdict.result() if isinstance(verdict, Future) else verdict
+                posting = posting.model_copy(
+                    update={
+                        "active_status": result.status,
+                        "active_reason": result.reason,
+                    }
+                )
+                if result.status == ActiveStatus.INACTIVE:
+                    continue
+                if result.status == ActiveStatus.UNKNOWN and args.drop_unknown_active:
+                    continue
+                checked.append(posting)
 
         # Postings beyond the limit are kept with their default UNKNOWN status
         checked.extend(postings[limit:])
         postings = checked
 
     # ── Persist dedup hashes for next run ─────────────────────────────────
-    save_hashes(settings.seen_hashes_path, dup_filter.hashes())
+    append_hashes(settings.seen_hashes_path, dup_filter.new_hashes())
 
     # ── Print summary ─────────────────────────────────────────────────────
     _print_summary(postings)
@@ -387,9 +429,7 @@ def _make_posting(result, ext, source_name: str):
         title=ext.title or result.title,
         company=ext.company or ("Unknown" if use_fallback else ""),
         location=ext.location or ("Unknown" if use_fallback else ""),
-        description=ext.description or (
-            result.snippet if use_fallback else ""
-        ),
+        description=ext.description or (result.snippet if use_fallback else ""),
         posting_url=result.url,
         apply_url=ext.apply_url,
         date_posted=ext.date_posted,
@@ -411,9 +451,7 @@ def _export_to_sheets(
 
     sheet_id = args.sheet_id or settings.sheet_id
     if not sheet_id:
-        print(
-            "Error: --sheet-id or IE_SHEET_ID is required for --export sheets."
-        )
+        print("Error: --sheet-id or IE_SHEET_ID is required for --export sheets.")
         return 1
 
     if not settings.google_service_account_json:
@@ -487,34 +525,41 @@ def _build_source(args: argparse.Namespace, settings):
     return GoogleSearchSource(config), "google"
 
 
+def _trunc(text: str, width: int) -> str:
+    """Return *text* cut to *width* characters, ending in ``..`` when cut."""
+    return text if len(text) <= width else text[: width - 2] + ".."
+
+
 def _print_summary(postings: list) -> None:
     """Print a human-readable table of matched postings."""
     if not postings:
         print("No postings matched the given filters.")
         return
 
-    print(f"\nFound {len(postings)} posting(s):\n")
     header = (
         f"  {'#':<3}  {'Category':<12}  {'Title':<40}"
         f"  {'Company':<25}  {'Location':<25}  Date"
     )
-    print(header)
-    print("  " + "-" * (len(header) - 2))
+    lines = [
+        f"\nFound {len(postings)} posting(s):\n",
+        header,
+        "  " + "-" * (len(header) - 2),
+    ]
 
     for i, p in enumerate(postings, start=1):
         cat = p.category.value if p.category else "?"
-        title = (p.title[:38] + "..") if len(p.title) > 40 else p.title
-        company = (p.company[:23] + "..") if len(p.company) > 25 else p.company
-        loc = (p.location[:23] + "..") if len(p.location) > 25 else p.location
         date_str = str(p.date_posted) if p.date_posted else "unknown"
         conf_marker = "" if p.date_posted_confidence.value == "exact" else "~"
-        row = (
-            f"  {i:<3}  {cat:<12}  {title:<40}"
-            f"  {company:<25}  {loc:<25}  {conf_marker}{date_str}"
+        lines.append(
+            f"  {i:<3}  {cat:<12}  {_trunc(p.title, 40):<40}"
+            f"  {_trunc(p.company, 25):<25}  {_trunc(p.location, 25):<25}"
+            f"  {conf_marker}{date_str}"
         )
-        print(row)
-        print(f"       {p.posting_url}")
-        print()
+        lines.append(f"       {p.posting_url}")
+        lines.append("")
+
+    # One write for the whole table instead of three prints per posting
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_menu(_args: argparse.Namespace) -> int:
@@ -12,6 +12,7 @@ IE_TARGET_CATEGORIES=software,data
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -85,6 +86,14 @@ class Settings(BaseSettings):
         description="File path used to persist seen posting hashes between runs.",
     )
 
+    query_stats_path: Path = Field(
+        default=Path(".cache/query_stats.json"),
+        description=(
+            "File path used to persist decayed per-query result counts, "
+            "which order the next run's queries most productive first."
+        ),
+    )
+
     # --- Google Sheets export -----------------------------------------
     sheet_id: Optional[str] = Field(
         default=None,
@@ -105,24 +114,34 @@ class Settings(BaseSettings):
         description="Name of the worksheet tab to write postings into (IE_SHEET_TAB).",
     )
 
+    sheet_trust_cache: bool = Field(
+        default=False,
+        description=(
+            "Keep a local copy of the sheet's posting hashes and use it instead "
+            "of reading the Hash column on later runs (IE_SHEET_TRUST_CACHE)."
+        ),
+    )
+
+    sheet_hash_cache_dir: Path = Field(
+        default=Path(".cache/sheets"),
+        description="Directory holding the per-sheet hash caches.",
+    )
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton with lazy initialisation
 # ---------------------------------------------------------------------------
 
-_settings: Settings | None = None
-
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Return the application-wide Settings singleton.
 
     Instantiated lazily on first call so that tests can patch environment
-    variables before the object is constructed.
+    variables before the object is constructed.  The environment and
+    ``.env`` file are read once per process.
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reset_settings() -> None:
@@ -131,5 +150,4 @@ def reset_settings() -> None:
     Intended for use in tests that need to vary environment variables
     between test cases.
     """
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
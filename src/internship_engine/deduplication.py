@@ -14,17 +14,16 @@ Typical usage
 
 from __future__ import annotations
 
-import hashlib
 import logging
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from internship_engine.models import JobPosting
+if TYPE_CHECKING:
+    from internship_engine.models import JobPosting
 
 logger = logging.getLogger(__name__)
 
-# Separator unlikely to appear in normal field values
-_SEP = "\x00"
-
 
 def compute_hash(posting: JobPosting) -> str:
     """Return a stable 64-character SHA-256 hex digest for *posting*.
@@ -43,15 +42,15 @@ def compute_hash(posting: JobPosting) -> str:
     -------
     str
         A 64-character lowercase hex string (SHA-256).
+
+    Notes
+    -----
+    The digest is persisted (``seen_hashes.txt`` and the Sheets ``hash``
+    column), so the algorithm is part of the on-disk format: changing it
+    would make every previously seen posting look new again.  The digest
+    is cached on the posting, so repeated calls do not rehash.
     """
-    canonical = _SEP.join(
-        [
-            posting.title.lower().strip(),
-            posting.company.lower().strip(),
-            posting.posting_url.lower().strip(),
-        ]
-    )
-    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return posting.dedup_hash
 
 
 class DuplicateFilter:
@@ -69,6 +68,7 @@ class DuplicateFilter:
 
     def __init__(self, initial_hashes: set[str] | None = None) -> None:
         self._seen: set[str] = set(initial_hashes or ())
+        self._added: list[str] = []
 
     # ------------------------------------------------------------------
     # Properties
@@ -93,14 +93,27 @@ class DuplicateFilter:
         if h in self._seen:
             return False
         self._seen.add(h)
+        self._added.append(h)
         return True
 
     def filter_new(self, postings: list[JobPosting]) -> list[JobPosting]:
         """Return only the postings not yet seen, recording each one.
 
-        Preserves the relative order of *postings*.
+        Preserves the relative order of *postings*.  Equivalent to calling
+        :meth:`is_new` on each posting, with the per-item method dispatch
+        hoisted out of the loop.
         """
-        return [p for p in postings if self.is_new(p)]
+        seen = self._seen
+        added = self._added
+        kept: list[JobPosting] = []
+        for posting in postings:
+            h = compute_hash(posting)
+            if h in seen:
+                continue
+            seen.add(h)
+            added.append(h)
+            kept.append(posting)
+        return kept
 
     # ------------------------------------------------------------------
     # Persistence helpers
@@ -113,6 +126,14 @@ class DuplicateFilter:
         """
         return frozenset(self._seen)
 
+    def new_hashes(self) -> tuple[str, ...]:
+        """Return the hashes recorded since construction, in insertion order.
+
+        Excludes ``initial_hashes``; pass the result to :func:`append_hashes`
+        to persist a run without rewriting the whole hash file.
+        """
+        return tuple(self._added)
+
 
 # ---------------------------------------------------------------------------
 # File-based persistence
@@ -140,16 +161,51 @@ def load_hashes(path: Path) -> set[str]:
     return hashes
 
 
+def write_text_atomic(path: Path, text: str) -> None:
+    """Replace *path* with *text* via a temporary sibling and ``os.replace``.
+
+    Parent directories are created as needed.  Readers never see a
+    half-written file.  ``OSError`` propagates to the caller.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
 def save_hashes(path: Path, hashes: frozenset[str] | set[str]) -> None:
     """Write *hashes* to *path*, one hex digest per line.
 
-    Creates parent directories if they do not exist.
+    Creates parent directories if they do not exist.  The file is written
+    to a sibling temporary file first and moved into place, so a crash
+    mid-write never leaves a truncated hash file behind.
     """
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            "\n".join(sorted(hashes)) + "\n",
-            encoding="utf-8",
-        )
+        write_text_atomic(path, "\n".join(sorted(hashes)) + "\n")
     except OSError as exc:
         logger.warning("Could not write hash file %s: %s", path, exc)
+
+
+def append_hashes(path: Path, hashes: tuple[str, ...] | list[str]) -> None:
+    """Append *hashes* to *path*, one hex digest per line.
+
+    Cheaper than :func:`save_hashes` when the file already holds earlier
+    runs' hashes: only the new lines are written.  Creates the file and its
+    parent directories if they do not exist; a no-op when *hashes* is empty.
+    If the existing file does not end in a newline (hand-edited or cut
+    short), one is written first so its last hash stays on its own line.
+    """
+    if not hashes:
+        return
+    text = "\n".join(hashes) + "\n"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("ab+") as fh:
+            end = fh.seek(0, os.SEEK_END)
+            if end:
+                fh.seek(end - 1)
+                if fh.read(1) != b"\n":
+                    text = "\n" + text
+            fh.write(text.encode("utf-8"))
+    except OSError as exc:
+        logger.warning("Could not append to hash file %s: %s", path, exc)
@@ -27,12 +27,17 @@ from __future__ import annotations
 
 import json
 import logging
+import re
+import threading
+import weakref
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Optional
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -45,9 +50,21 @@ _USER_AGENT = (
     "+https://github.com/example/internship-discovery-engine)"
 )
 _TIMEOUT = 10  # seconds per request
+# The meta fallback reads only these tags; skipping the rest keeps
+# html.parser from building a tree for the whole page body.
+_META_ONLY = SoupStrainer(["meta", "title"])
+# Body of every <script type="application/ld+json"> block
+_JSONLD_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>"""
+    r"(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
 _RETRY_TOTAL = 3
 _RETRY_BACKOFF = 0.4
 _RETRY_ON_STATUS = [429, 500, 502, 503, 504]
+_POOL_CONNECTIONS = 32  # distinct hosts kept alive
+_MAX_PER_HOST = 4  # concurrent in-flight requests to any single host
+_POOL_MAXSIZE = _MAX_PER_HOST  # connections kept alive per host
 
 
 # ---------------------------------------------------------------------------
@@ -116,7 +133,7 @@ def parse_html(html: str, source_url: str = "") -> ExtractionResult:
         Returns an empty result (all defaults) if neither source provides
         data.
     """
-    schema, soup = _find_job_posting_schema(html)
+    schema = _find_job_posting_schema(html)
 
     if schema is not None:
         date_posted, confidence = _parse_date(schema.get("datePosted"))
@@ -134,7 +151,9 @@ def parse_html(html: str, source_url: str = "") -> ExtractionResult:
         )
 
     # No JSON-LD — try meta / Open Graph tags as a lightweight fallback
-    return _fallback_from_meta(soup)
+    return _fallback_from_meta(
+        BeautifulSoup(html, "html.parser", parse_only=_META_ONLY)
+    )
 
 
 class Extractor:
@@ -151,6 +170,11 @@ class Extractor:
     def __init__(self, session: requests.Session | None = None) -> None:
         self._session = session or _make_session()
 
+    @property
+    def session(self) -> requests.Session:
+        """The underlying session, shared with follow-up requests (active-check)."""
+        return self._session
+
     def fetch_and_extract(self, url: str) -> ExtractionResult:
         """Fetch *url* and return an :class:`ExtractionResult`.
 
@@ -211,28 +235,23 @@ class Extractor:
 # ---------------------------------------------------------------------------
 
 
-def _find_job_posting_schema(
-    html: str,
-) -> tuple[dict | None, BeautifulSoup]:
-    """Return ``(schema, soup)`` from *html*.
+def _find_job_posting_schema(html: str) -> dict | None:
+    """Return the first JSON-LD ``JobPosting`` object in *html*, or ``None``.
 
-    *schema* is the first JSON-LD ``JobPosting`` object found, or ``None``.
-    The :class:`BeautifulSoup` instance is always returned so callers can
-    attempt meta-tag fallback without re-parsing.
+    Script bodies are pulled out with :data:`_JSONLD_RE` rather than an HTML
+    parser: they are the only part of the page this lookup needs.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    for script in soup.find_all("script", type="application/ld+json"):
-        raw = script.string or ""
+    for match in _JSONLD_RE.finditer(html):
         try:
-            data = json.loads(raw)
+            data = json.loads(match.group(1))
         except (json.JSONDecodeError, ValueError):
             continue
 
         found = _extract_job_posting(data)
         if found is not None:
-            return found, soup
+            return found
 
-    return None, soup
+    return None
 
 
 def _is_job_posting(type_value: object) -> bool:
@@ -259,20 +278,23 @@ def _is_job_posting(type_value: object) -> bool:
 
 
 def _extract_job_posting(data: object) -> dict | None:
-    """Recursively search *data* for a JobPosting dict."""
-    if isinstance(data, dict):
-        if _is_job_posting(data.get("@type")):
-            return data
-        # Check @graph array (common pattern)
-        for item in data.get("@graph", []):
-            result = _extract_job_posting(item)
-            if result is not None:
-                return result
-    elif isinstance(data, list):
-        for item in data:
-            result = _extract_job_posting(item)
-            if result is not None:
-                return result
+    """Search *data* depth-first for a JobPosting dict.
+
+    Walks an explicit stack rather than recursing; children are pushed in
+    reverse so the first match in document order wins.
+    """
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _is_job_posting(node.get("@type")):
+                return node
+            # Check @graph array (common pattern)
+            graph = node.get("@graph")
+            if isinstance(graph, list):
+                stack.extend(reversed(graph))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
     return None
 
 
@@ -392,15 +414,19 @@ def _parse_date(
     """
     if not date_str or not isinstance(date_str, str):
         return None, DatePostedConfidence.UNKNOWN
+    return _parse_date_str(date_str.strip())
 
-    raw = date_str.strip()
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(raw: str) -> tuple[Optional[date], DatePostedConfidence]:
+    """Cached core of :func:`_parse_date`; listings often share a date."""
     try:
         parsed = datetime.fromisoformat(raw)
         return parsed.date(), DatePostedConfidence.EXACT
     except ValueError:
         pass
 
-    logger.debug("Could not parse datePosted %r", date_str)
+    logger.debug("Could not parse datePosted %r", raw)
     return None, DatePostedConfidence.UNKNOWN
 
 
@@ -417,17 +443,95 @@ def _parse_apply_url(schema: dict, source_url: str) -> Optional[str]:
 # ---------------------------------------------------------------------------
 
 
+class _HostThrottledAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that caps concurrent requests per host (netloc).
+
+    The pipeline fetches pages from several worker threads; the cap lets
+    them run in parallel across hosts without piling onto a single job
+    board, which tends to answer bursts with HTTP 429.
+
+    A request holds its host's slot until its connection goes back to the
+    pool, i.e. until the body has been read to the end or the response is
+    closed, so streamed bodies count against the cap while they download.
+    A response that is dropped without either frees its slot when it is
+    garbage-collected.
+    """
+
+    def __init__(self, *args, max_per_host: int = _MAX_PER_HOST, **kwargs) -> None:
+        self._max_per_host = max_per_host
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        slot = self._slot(urlsplit(request.url).netloc)
+        slot.acquire()
+        try:
+            response = super().send(request, **kwargs)
+        except BaseException:
+            slot.release()
+            raise
+        _release_with_connection(response, slot)
+        return response
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._max_per_host)
+                self._host_slots[host] = slot
+            return slot
+
+
+def _release_with_connection(response, slot: threading.BoundedSemaphore) -> None:
+    """Release *slot* once, when *response* hands its connection back.
+
+    urllib3 calls ``release_conn`` when the body is exhausted and requests
+    calls it from ``Response.close()``; the wrapper piggybacks on both.
+    """
+    released = threading.Lock()
+
+    def release() -> None:
+        if released.acquire(blocking=False):
+            slot.release()
+
+    raw = getattr(response, "raw", None)
+    release_conn = getattr(raw, "release_conn", None)
+    if release_conn is None:
+        release()
+        return
+
+    def release_conn_and_slot() -> None:
+        try:
+            release_conn()
+        finally:
+            release()
+
+    raw.release_conn = release_conn_and_slot
+    weakref.finalize(response, release)
+
+
 def _make_session() -> requests.Session:
-    """Return a requests.Session with retry logic and a polite User-Agent."""
+    """Return a requests.Session with retry logic and a polite User-Agent.
+
+    The adapter keeps a pool of keep-alive connections per host so repeated
+    hits to the same job board reuse the TCP/TLS connection, and caps
+    in-flight requests per host at ``_MAX_PER_HOST``.  Retried 429/503
+    responses honour the server's ``Retry-After`` header (urllib3 default).
+    """
     session = requests.Session()
     retry = Retry(
         total=_RETRY_TOTAL,
         backoff_factor=_RETRY_BACKOFF,
         status_forcelist=_RETRY_ON_STATUS,
-        allowed_methods=["GET"],
+        allowed_methods=["GET", "HEAD"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = _HostThrottledAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=retry,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     session.headers.update(
@@ -10,9 +10,12 @@ Filtering rules (evaluated in order):
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from internship_engine.models import JobPosting
+if TYPE_CHECKING:
+    from internship_engine.models import JobPosting
 
 
 @dataclass(frozen=True)
@@ -32,6 +35,20 @@ class LocationFilter:
 
     allowed_locations: tuple[str, ...] = field(default_factory=tuple)
     include_remote: bool = True
+    _allowed_re: re.Pattern[str] | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Lower-case the patterns once rather than on every matches() call,
+        # and fold them into one alternation so matching is a single scan
+        object.__setattr__(
+            self,
+            "_allowed_re",
+            re.compile(
+                "|".join(re.escape(loc.lower()) for loc in self.allowed_locations)
+            )
+            if self.allowed_locations
+            else None,
+        )
 
     def matches(self, posting: JobPosting) -> bool:
         """Return *True* if *posting* should be included.
@@ -44,11 +61,10 @@ class LocationFilter:
         if posting.is_remote:
             return self.include_remote
 
-        if not self.allowed_locations:
+        if self._allowed_re is None:
             return True
 
-        location_lower = posting.location.lower()
-        return any(loc.lower() in location_lower for loc in self.allowed_locations)
+        return self._allowed_re.search(posting.location_lower) is not None
 
 
 def apply_location_filter(
@@ -64,4 +80,5 @@ def apply_location_filter(
     location_filter:
         :class:`LocationFilter` instance defining the acceptance criteria.
     """
-    return [p for p in postings if location_filter.matches(p)]
+    matches = location_filter.matches  # bound once for the loop
+    return [p for p in postings if matches(p)]
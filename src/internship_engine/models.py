@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 from datetime import date
 from enum import Enum
-from typing import Optional
+from functools import cached_property
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 
@@ -71,6 +73,18 @@ class JobPosting(BaseModel):
     source:                 Identifier for the data source (e.g. "google").
     category:               Assigned category; None until categorization is run.
     is_remote:              True when fully remote. Auto-inferred from location.
+
+    Derived (cached, not serialised)
+    --------------------------------
+    search_text:            Lower-cased ``title + " " + description`` used by
+                            keyword matchers.
+    title_lower:            Lower-cased ``title`` used by track scoring.
+    description_lower:      Lower-cased ``description`` used by track scoring.
+    location_lower:         Lower-cased ``location`` used by the location filter.
+    dedup_key:              Lower-cased, NUL-joined ``title``, ``company`` and
+                            ``posting_url``.
+    dedup_hash:             SHA-256 hex digest of ``dedup_key``; see
+                            :func:`~internship_engine.deduplication.compute_hash`.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -105,3 +119,65 @@ class JobPosting(BaseModel):
         if not self.is_remote and "remote" in self.location.lower():
             object.__setattr__(self, "is_remote", True)
         return self
+
+    # ------------------------------------------------------------------
+    # Derived text (computed once per instance)
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lower-cased ``title`` and ``description`` joined by a space."""
+        return f"{self.title} {self.description}".lower()
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lower-cased ``title``."""
+        return self.title.lower()
+
+    @cached_property
+    def description_lower(self) -> str:
+        """Lower-cased ``description``."""
+        return self.description.lower()
+
+    @cached_property
+    def location_lower(self) -> str:
+        """Lower-cased ``location``."""
+        return self.location.lower()
+
+    @cached_property
+    def dedup_key(self) -> str:
+        """Canonical identity string: title, company and URL, NUL-separated."""
+        return "\x00".join(
+            (
+                self.title.lower().strip(),
+                self.company.lower().strip(),
+                self.posting_url.lower().strip(),
+            )
+        )
+
+    @cached_property
+    def dedup_hash(self) -> str:
+        """SHA-256 hex digest of :attr:`dedup_key`."""
+        return hashlib.sha256(self.dedup_key.encode("utf-8")).hexdigest()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "JobPosting":
+        """Copy the posting, dropping cached text derived from updated fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for name, sources in _DERIVED_TEXT.items():
+                if not sources.isdisjoint(update):
+                    copied.__dict__.pop(name, None)
+        return copied
+
+
+# Cached property name -> the fields it is computed from
+_DERIVED_TEXT: dict[str, frozenset[str]] = {
+    "search_text": frozenset({"title", "description"}),
+    "title_lower": frozenset({"title"}),
+    "description_lower": frozenset({"description"}),
+    "location_lower": frozenset({"location"}),
+    "dedup_key": frozenset({"title", "company", "posting_url"}),
+    "dedup_hash": frozenset({"title", "company", "posting_url"}),
+}
@@ -30,10 +30,12 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 from datetime import date
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from internship_engine.deduplication import compute_hash
+from internship_engine.deduplication import compute_hash, load_hashes, save_hashes
 
 if TYPE_CHECKING:
     import gspread
@@ -47,7 +49,7 @@ logger = logging.getLogger(__name__)
 # Column definitions (order matters — must match sheet header)
 # ---------------------------------------------------------------------------
 
-COLUMNS: list[str] = [
+COLUMNS: tuple[str, ...] = (
     "Added At",
     "Category",
     "Title",
@@ -62,7 +64,7 @@ COLUMNS: list[str] = [
     "Status",
     "Status Reason",
     "Track Match",
-]
+)
 
 _HASH_COL_INDEX = COLUMNS.index("Hash")  # 0-based
 
@@ -118,37 +120,47 @@ def build_client_from_env(settings: Settings) -> gspread.Client:
 def ensure_header(worksheet: gspread.Worksheet) -> None:
     """Ensure the first row of *worksheet* contains exactly :data:`COLUMNS`.
 
-    Three behaviours:
+    Four behaviours:
 
     * **Empty sheet** — the full header is inserted as row 1.
     * **Exact match** — no-op.
     * **Prefix match** — the existing header is a valid leading subset of
       :data:`COLUMNS` (e.g. the legacy 11-column layout).  Missing columns are
-      appended to row 1 via individual ``update_cell`` calls (auto-migration).
-    * **Mismatch** — ``ValueError`` is raised.
+      written to row 1 in a single range ``update`` call (auto-migration).
+    * **Mismatch** — ``ValueError`` is raised, as it is when row 1 is empty
+      but rows below it hold data (inserting a header there would shift the
+      data under columns it was not written for).
 
     Parameters
     ----------
     worksheet:
         The target worksheet object.
     """
-    existing = worksheet.get_all_values()
-    if not existing:
-        worksheet.insert_row(COLUMNS, 1)
+    # Only row 1 is fetched; data rows are only read when it is empty
+    existing_header = worksheet.row_values(1)
+    if not any(existing_header):
+        if any(any(row) for row in worksheet.get_all_values()):
+            raise ValueError(
+                "Sheet header row is empty but the sheet holds data.\n"
+                "Please restore the header row or clear the sheet before running."
+            )
+        worksheet.insert_row(list(COLUMNS), 1)
         logger.debug("Inserted header row into empty sheet.")
         return
 
-    existing_header = existing[0]
-
-    if existing_header == COLUMNS:
+    header = tuple(existing_header)
+    if header == COLUMNS:
         return  # already correct
 
     # Auto-migration: append missing columns if existing header is a prefix
-    n = len(existing_header)
-    if 0 < n < len(COLUMNS) and existing_header == COLUMNS[:n]:
-        missing = COLUMNS[n:]
-        for i, col_name in enumerate(missing):
-            worksheet.update_cell(1, n + 1 + i, col_name)
+    n = len(header)
+    if 0 < n < len(COLUMNS) and header == COLUMNS[:n]:
+        missing = list(COLUMNS[n:])
+        worksheet.update(
+            [missing],
+            f"{_col_letter(n + 1)}1:{_col_letter(len(COLUMNS))}1",
+            value_input_option="USER_ENTERED",
+        )
         logger.info(
             "Auto-migrated sheet header: appended %d column(s): %s",
             len(missing),
@@ -158,17 +170,27 @@ def ensure_header(worksheet: gspread.Worksheet) -> None:
 
     raise ValueError(
         f"Sheet header mismatch.\n"
-        f"  Expected: {COLUMNS}\n"
+        f"  Expected: {list(COLUMNS)}\n"
         f"  Found:    {existing_header}\n"
         "Please fix the sheet header or clear the sheet before running."
     )
 
 
+def read_hashes(worksheet: gspread.Worksheet) -> set[str]:
+    """Return the non-empty ``Hash`` column values of *worksheet*.
+
+    Only that column is fetched, not the whole sheet; the header is skipped.
+    """
+    hash_col = worksheet.col_values(_HASH_COL_INDEX + 1)[1:]
+    return {h.strip() for h in hash_col if h.strip()}
+
+
 def upsert_rows(
     worksheet: gspread.Worksheet,
     postings: list[JobPosting],
     *,
     added_at: date | None = None,
+    existing_hashes: set[str] | None = None,
 ) -> int:
     """Append postings not yet present in *worksheet*.
 
@@ -184,6 +206,10 @@ def upsert_rows(
         List of :class:`~internship_engine.models.JobPosting` objects to write.
     added_at:
         Date to record in the "Added At" column.  Defaults to today.
+    existing_hashes:
+        Hashes already present in the sheet.  Read with :func:`read_hashes`
+        when ``None``.  The set is updated in place with the hashes of the
+        appended rows.
 
     Returns
     -------
@@ -192,16 +218,10 @@ def upsert_rows(
     """
     today_str = (added_at or date.today()).isoformat()
 
-    # Collect existing hashes (column is 0-based _HASH_COL_INDEX)
-    all_values = worksheet.get_all_values()
-    existing_hashes: set[str] = set()
-    for row in all_values[1:]:  # skip header
-        if len(row) > _HASH_COL_INDEX:
-            h = row[_HASH_COL_INDEX].strip()
-            if h:
-                existing_hashes.add(h)
+    if existing_hashes is None:
+        existing_hashes = read_hashes(worksheet)
 
-    new_rows: list[list[str]] = []
+    new_rows: list[tuple[str, ...]] = []
     for posting in postings:
         h = compute_hash(posting)
         if h in existing_hashes:
@@ -250,6 +270,13 @@ def export_postings(
     int
         Number of rows appended (0 if all were duplicates).
 
+    Notes
+    -----
+    With ``settings.sheet_trust_cache`` enabled, the sheet's hashes are kept
+    in a local file under ``settings.sheet_hash_cache_dir``.  Once that file
+    exists, later runs use it instead of reading the ``Hash`` column, so rows
+    deleted from the sheet by hand are not re-added.
+
     Raises
     ------
     ValueError
@@ -268,7 +295,17 @@ def export_postings(
     worksheet = spreadsheet.worksheet(tab)
 
     ensure_header(worksheet)
-    return upsert_rows(worksheet, postings)
+    if not settings.sheet_trust_cache:
+        return upsert_rows(worksheet, postings)
+
+    cache_path = _hash_cache_path(settings.sheet_hash_cache_dir, sid, tab)
+    if cache_path.is_file():
+        hashes = load_hashes(cache_path)
+    else:
+        hashes = read_hashes(worksheet)
+    added = upsert_rows(worksheet, postings, existing_hashes=hashes)
+    save_hashes(cache_path, hashes)
+    return added
 
 
 # ---------------------------------------------------------------------------
@@ -276,9 +313,24 @@ def export_postings(
 # ---------------------------------------------------------------------------
 
 
-def _posting_to_row(posting: JobPosting, h: str, added_at: str) -> list[str]:
-    """Convert a posting to a list of cell values matching :data:`COLUMNS`."""
-    return [
+def _hash_cache_path(cache_dir: Path, sheet_id: str, tab_name: str) -> Path:
+    """Return the local hash-cache file for one sheet tab."""
+    safe = re.sub(r"[^\w.-]", "_", f"{sheet_id}-{tab_name}")
+    return cache_dir / f"hashes-{safe}.txt"
+
+
+def _col_letter(index: int) -> str:
+    """Return the A1 column letters for 1-based column *index* (1 → A, 27 → AA)."""
+    letters = ""
+    while index > 0:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _posting_to_row(posting: JobPosting, h: str, added_at: str) -> tuple[str, ...]:
+    """Convert a posting to a tuple of cell values matching :data:`COLUMNS`."""
+    return (
         added_at,
         posting.category.value if posting.category else "",
         posting.title,
@@ -293,4 +345,4 @@ def _posting_to_row(posting: JobPosting, h: str, added_at: str) -> list[str]:
         posting.active_status.value,
         posting.active_reason,
         posting.track_match,
-    ]
+    )
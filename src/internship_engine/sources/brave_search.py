@@ -11,29 +11,40 @@ GitHub Actions secrets.
 
 Query construction
 ------------------
-Reuses :func:`~internship_engine.sources.google_search.build_queries` so
+Reuses :func:`~internship_engine.sources.google_search.iter_queries` so
 that query logic is shared across providers.
 
 Pagination
 ----------
 The Brave API supports an ``offset`` parameter.  Each page returns up to
 20 results.  The source paginates until ``max_results`` is reached or no
-more results are available.
+more results are available; pages after the first are requested
+concurrently (see :func:`~internship_engine.sources.google_search.fetch_pages`).
 
 Rate limiting
 -------------
-HTTP 429 responses trigger exponential-backoff retries (up to 3 attempts).
+HTTP 429 responses trigger retries (up to 3 attempts) with exponential
+backoff.  A longer ``Retry-After`` delay from the server is honoured.
 """
 
 from __future__ import annotations
 
 import logging
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
 
-from internship_engine.sources.google_search import RawSearchResult, build_queries
+from internship_engine.sources.google_search import (
+    RawSearchResult,
+    api_session,
+    collect_results,
+    fetch_pages,
+    iter_queries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +57,13 @@ _PAGE_SIZE = 20
 # Retry configuration for HTTP 429 rate limiting
 _MAX_RETRIES = 3
 _INITIAL_BACKOFF = 1.0  # seconds
+_MAX_RETRY_AFTER = 60.0  # cap on a server-requested delay, in seconds
+
+# Concurrent page requests per query once the first page comes back full
+_PAGE_WORKERS = 4
+# Queries run ahead of result collection; kept low since Brave rate-limits
+# per second and each query may itself fan out into concurrent pages
+_QUERY_WORKERS = 2
 
 
 # ---------------------------------------------------------------------------
@@ -87,6 +105,32 @@ def _freshness_value(days: int | None) -> str | None:
     return None
 
 
+def _parse_retry_after(value: object) -> float | None:
+    """Return the delay in seconds requested by a ``Retry-After`` header.
+
+    Accepts both forms allowed by RFC 9110: delay-seconds (``1*DIGIT``) or
+    an HTTP date.  Anything else (``"nan"``, ``"1e3"``, ``"-5"``, ``"0.5"``)
+    returns *None*, as does an absent header; the delay is clamped to
+    ``[0, _MAX_RETRY_AFTER]``.
+    """
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    if value.isascii() and value.isdigit():
+        seconds = float(int(value))
+    else:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), _MAX_RETRY_AFTER)
+
+
 class BraveSearchSource:
     """Fetches raw search results from the Brave Web Search API.
 
@@ -110,6 +154,7 @@ class BraveSearchSource:
     ) -> None:
         self._config = config
         self._session = session or self._default_session(config.api_key)
+        self._page_cache: dict[str, list[dict]] = {}
         self._sleep = sleep_fn
 
     # ------------------------------------------------------------------
@@ -122,6 +167,8 @@ class BraveSearchSource:
         keywords: list[str],
         categories: list[str],
         ats_domains: dict[str, list[str]] | None = None,
+        productivity: Mapping[str, float] | None = None,
+        query_hits: dict[str, int] | None = None,
     ) -> list[RawSearchResult]:
         """Run queries and return deduplicated search results.
 
@@ -129,52 +176,49 @@ class BraveSearchSource:
         :meth:`~internship_engine.sources.google_search.GoogleSearchSource.fetch`
         so both providers are interchangeable from the CLI pipeline.
         """
-        queries = build_queries(
-            locations, keywords, categories, ats_domains=ats_domains
+        queries = iter_queries(
+            locations,
+            keywords,
+            categories,
+            ats_domains=ats_domains,
+            productivity=productivity,
         )
 
-        seen_urls: set[str] = set()
-        results: list[RawSearchResult] = []
-
-        for q in queries:
-            if len(results) >= self._config.max_results:
-                break
-            for item in self._paginate(q):
-                url = (item.get("url") or "").strip()
-                if not url or url in seen_urls:
-                    continue
-                seen_urls.add(url)
-                results.append(
-                    RawSearchResult(
-                        url=url,
-                        title=(item.get("title") or "").strip(),
-                        snippet=(item.get("description") or "").strip(),
-                    )
-                )
-                if len(results) >= self._config.max_results:
-                    break
-
-        return results
+        return collect_results(
+            self._paginate,
+            queries,
+            workers=_QUERY_WORKERS,
+            url_key="url",
+            title_key="title",
+            snippet_key="description",
+            max_results=self._config.max_results,
+            hits=query_hits,
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _paginate(self, query: str) -> list[dict]:
-        """Return all web result items for *query*, paginating as needed."""
-        items: list[dict] = []
-        offset = 0
-
-        while len(items) < self._config.max_results:
-            batch = self._search(query, offset=offset)
-            if not batch:
-                break
-            items.extend(batch)
-            if len(batch) < _PAGE_SIZE:
-                break  # last page
-            offset += _PAGE_SIZE
+        """Return all web result items for *query*, paginating as needed.
 
-        return items[: self._config.max_results]
+        Results are memoised per query for the lifetime of the source, so a
+        query repeated within a run (e.g. a duplicated location) costs no
+        further API calls.
+        """
+        cached = self._page_cache.get(query)
+        if cached is not None:
+            return cached
+        items = fetch_pages(
+            lambda offset: self._search(query, offset=offset),
+            range(0, self._config.max_results, _PAGE_SIZE),
+            page_size=_PAGE_SIZE,
+            max_results=self._config.max_results,
+            workers=_PAGE_WORKERS,
+        )
+        if items:  # leave failed or empty queries to be retried
+            self._page_cache[query] = items
+        return items
 
     def _search(self, query: str, offset: int = 0) -> list[dict]:
         """Execute a single API request with 429-retry logic.
@@ -197,15 +241,21 @@ class BraveSearchSource:
                 resp = self._session.get(_BRAVE_URL, params=params, timeout=15)
                 if resp.status_code == 429:
                     if attempt < _MAX_RETRIES:
+                        retry_after = _parse_retry_after(
+                            resp.headers.get("Retry-After")
+                        )
+                        # Never below the backoff: "Retry-After: 0" must not
+                        # turn the retries into a tight loop
+                        wait = max(backoff, retry_after or 0.0)
                         logger.warning(
                             "Brave API 429 rate-limited; retrying in %.1fs"
                             " (attempt %d/%d)",
-                            backoff,
+                            wait,
                             attempt + 1,
                             _MAX_RETRIES,
                         )
-                        self._sleep(backoff)
-                        backoff *= 2
+                        self._sleep(wait)
+                        backoff = max(backoff * 2, wait)
                         continue
                     logger.warning(
                         "Brave API 429 rate-limited; exhausted %d retries",
@@ -239,12 +289,12 @@ class BraveSearchSource:
 
     @staticmethod
     def _default_session(api_key: str) -> requests.Session:
-        session = requests.Session()
-        session.headers.update(
+        return api_session(
             {
                 "Accept": "application/json",
                 "Accept-Encoding": "gzip",
                 "X-Subscription-Token": api_key,
-            }
+            },
+            page_workers=_PAGE_WORKERS,
+            query_workers=_QUERY_WORKERS,
         )
-        return session
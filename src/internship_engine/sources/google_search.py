@@ -16,19 +16,33 @@ Queries are assembled from:
   4. One location string per query (one query is emitted per location;
      no location means a single query with no geo-restriction).
 
+Queries can be reordered by past productivity (see
+:func:`update_productivity`) so the queries most likely to fill
+``max_results`` are sent first and later ones are never needed.
+
 Pagination
 ----------
 The API returns at most 10 results per request.  When ``max_results``
 exceeds 10 the source makes multiple paginated requests (using the
-``start`` parameter) up to the API's hard ceiling of 100 results.
+``start`` parameter) up to the API's hard ceiling of 100 results.  Pages
+after the first are requested concurrently (see :func:`fetch_pages`).
 """
 
 from __future__ import annotations
 
+import json
 import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from internship_engine.deduplication import write_text_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +65,17 @@ _CSE_URL = "https://www.googleapis.com/customsearch/v1"
 _PAGE_SIZE = 10
 _MAX_START = 91
 
+# Concurrent page requests per query once the first page comes back full
+_PAGE_WORKERS = 4
+# Queries run ahead of result collection while they are likely to be needed
+_QUERY_WORKERS = 4
+
+# Weight kept by a query's past productivity score each time it runs again
+_PRODUCTIVITY_DECAY = 0.5
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 # ---------------------------------------------------------------------------
 # Value objects
@@ -87,6 +112,7 @@ def build_queries(
     categories: list[str],
     terms: list[str] | None = None,
     ats_domains: dict[str, list[str]] | None = None,
+    productivity: Mapping[str, float] | None = None,
 ) -> list[str]:
     """Return a list of search query strings in priority order.
 
@@ -115,6 +141,11 @@ def build_queries(
         Optional mapping of platform name → list of ``site:`` domain
         patterns (e.g. ``{"workday": ["*.myworkdayjobs.com"]}``).
         When provided, site-restricted queries are prepended.
+    productivity:
+        Optional mapping of query → productivity score from earlier runs
+        (see :func:`update_productivity`).  Within the ATS queries of each
+        domain, and within the generic queries, the most productive are
+        emitted first; ties and unknown queries keep their given order.
 
     Returns
     -------
@@ -122,6 +153,24 @@ def build_queries(
         ATS-targeted queries (if any) followed by generic queries.
         Never returns an empty list.
     """
+    return list(
+        iter_queries(locations, keywords, categories, terms, ats_domains, productivity)
+    )
+
+
+def iter_queries(
+    locations: list[str],
+    keywords: list[str],
+    categories: list[str],
+    terms: list[str] | None = None,
+    ats_domains: dict[str, list[str]] | None = None,
+    productivity: Mapping[str, float] | None = None,
+) -> Iterator[str]:
+    """Yield the queries of :func:`build_queries` lazily, in the same order.
+
+    Callers that stop once they have enough results never format the
+    queries they would not have sent.
+    """
     effective_terms = terms if terms is not None else _DEFAULT_TERMS[:2]
 
     base_tokens: list[str] = []
@@ -136,23 +185,280 @@ def build_queries(
 
     base = " ".join(base_tokens)
 
-    # Build location-expanded generic queries
+    # Location-expanded generic queries
     if not locations:
-        generic = [base]
+        generic: tuple[str, ...] = (base,)
     else:
-        generic = [f"{base} {loc}" for loc in locations]
+        generic = tuple(f"{base} {loc}" for loc in locations)
 
-    if not ats_domains:
-        return generic
+    def ranked(queries: Iterable[str]) -> Iterable[str]:
+        if not productivity:
+            return queries
+        return sorted(queries, key=lambda q: -productivity.get(q, 0))
 
-    # Build ATS-targeted queries: one per domain per generic query
-    ats_queries: list[str] = []
-    for domains in ats_domains.values():
-        for domain in domains:
-            for g in generic:
-                ats_queries.append(f"{g} site:{domain}")
+    # ATS-targeted queries first: one per domain per generic query
+    if ats_domains:
+        for domains in ats_domains.values():
+            for domain in domains:
+                yield from ranked(f"{g} site:{domain}" for g in generic)
 
-    return ats_queries + generic
+    yield from ranked(generic)
+
+
+def load_productivity(path: Path) -> dict[str, float]:
+    """Load the query → productivity scores written by :func:`save_productivity`.
+
+    Returns an empty dict when the file does not exist or cannot be parsed;
+    the counts only influence query order, so a bad file is not an error.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable productivity file %s: %s", path, exc)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        query: float(score)
+        for query, score in data.items()
+        if isinstance(query, str)
+        and isinstance(score, (int, float))
+        and not isinstance(score, bool)
+    }
+
+
+def update_productivity(
+    productivity: Mapping[str, float],
+    hits: Mapping[str, int],
+    *,
+    decay: float = _PRODUCTIVITY_DECAY,
+) -> dict[str, float]:
+    """Return *productivity* with this run's per-query *hits* folded in.
+
+    Each query that ran scores ``decay * previous + hits``, an
+    exponentially decayed sum, so a query that stops producing sinks in
+    the order within a few runs instead of riding on its lifetime total.
+    Queries that did not run keep their score unchanged.
+
+    Parameters
+    ----------
+    productivity:
+        Scores from earlier runs, keyed by query.
+    hits:
+        New unique results each query contributed this run, as filled in
+        by :func:`collect_results`.
+    decay:
+        Weight kept by the previous score of a query that ran.
+    """
+    updated = dict(productivity)
+    for query, count in hits.items():
+        updated[query] = decay * updated.get(query, 0.0) + count
+    return updated
+
+
+def save_productivity(path: Path, productivity: Mapping[str, float]) -> None:
+    """Write *productivity* to *path* as JSON, replacing any existing file.
+
+    Written atomically with
+    :func:`~internship_engine.deduplication.write_text_atomic`.  A failed
+    write (e.g. a read-only working directory) is logged, not raised: the
+    counts only tune query order and must never end a finished run.
+    """
+    text = json.dumps(dict(productivity), indent=2, sort_keys=True)
+    try:
+        write_text_atomic(path, text)
+    except OSError as exc:
+        logger.warning("Could not write productivity file %s: %s", path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Sessions, pagination and result collection (shared by all sources)
+# ---------------------------------------------------------------------------
+
+
+def api_session(
+    headers: Mapping[str, str], *, page_workers: int, query_workers: int
+) -> requests.Session:
+    """Return a session for a search API, sending *headers* on every request.
+
+    The HTTPS pool keeps one keep-alive connection per possible in-flight
+    request: *query_workers* queries, each fanning out into up to
+    *page_workers* concurrent page requests.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=page_workers * query_workers),
+    )
+    return session
+
+
+def prefetch(
+    fn: Callable[[T], R],
+    args: Iterable[T],
+    *,
+    workers: int,
+    ahead: Callable[[int], bool] | None = None,
+) -> Iterator[R]:
+    """Yield ``fn(arg)`` for each of *args*, in order, running ahead of the consumer.
+
+    Up to *workers* calls are kept in flight.  *args* is consumed only as
+    calls are started, and calls not yet started are cancelled when the
+    consumer stops early.  While at least one call is in flight, another is
+    started only if ``ahead(in_flight)`` returns true (always, when *ahead*
+    is *None*), letting the consumer stop the lookahead once the calls
+    already running are likely to give it all it needs.
+    """
+    pending: deque[Future[R]] = deque()
+    remaining = iter(args)
+    exhausted = False
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            while True:
+                while (
+                    not exhausted
+                    and len(pending) < workers
+                    and (not pending or ahead is None or ahead(len(pending)))
+                ):
+                    try:
+                        arg = next(remaining)
+                    except StopIteration:
+                        exhausted = True
+                    else:
+                        pending.append(pool.submit(fn, arg))
+                if not pending:
+                    return
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def fetch_pages(
+    search: Callable[[int], list[dict]],
+    offsets: Sequence[int],
+    *,
+    page_size: int,
+    max_results: int,
+    workers: int = _PAGE_WORKERS,
+) -> list[dict]:
+    """Fetch result pages at *offsets*, in order, until *max_results* items.
+
+    The first page is requested on its own.  If it comes back full, the
+    pages still needed are requested concurrently, up to *workers* at a
+    time, and their items are appended in offset order.  Pagination stops
+    at the first empty or short page.  That costs at most ``workers - 1``
+    speculative requests past the last page.
+
+    Parameters
+    ----------
+    search:
+        Callable that performs one API request at the given offset and
+        returns its items (``[]`` on failure).
+    offsets:
+        Offsets of the pages that may be requested, in order.
+    page_size:
+        Items per full page.
+    max_results:
+        Maximum number of items to return.
+    workers:
+        Maximum concurrent page requests.
+    """
+    items: list[dict] = []
+    pos = 0
+    wave = 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pos < len(offsets) and len(items) < max_results:
+            needed = -(-(max_results - len(items)) // page_size)
+            chunk = offsets[pos : pos + min(wave, needed)]
+            pos += len(chunk)
+            batches = pool.map(search, chunk) if len(chunk) > 1 else map(search, chunk)
+            for batch in batches:
+                if not batch:
+                    return items[:max_results]
+                items.extend(batch)
+                if len(batch) < page_size:
+                    return items[:max_results]  # last page
+            wave = workers
+    return items[:max_results]
+
+
+def collect_results(
+    search: Callable[[str], list[dict]],
+    queries: Iterable[str],
+    *,
+    workers: int,
+    url_key: str,
+    title_key: str,
+    snippet_key: str,
+    max_results: int,
+    hits: dict[str, int] | None = None,
+) -> list[RawSearchResult]:
+    """Run *queries* through *search* and merge the items into unique results.
+
+    Items are deduplicated by stripped URL; items without a URL are skipped.
+    Queries run in order through :func:`prefetch` and collection stops as
+    soon as *max_results* results are held.  A query is started ahead of
+    the one being waited on only while the results held, plus the expected
+    yield of the queries in flight (the mean of those finished so far),
+    fall short of *max_results*.  The lookahead therefore starts at zero,
+    shrinks as the cap nears, and wastes about one query's worth of
+    requests at most, instead of ``workers - 1`` whole queries.
+
+    Parameters
+    ----------
+    search:
+        Callable that returns all provider-specific item dicts for a query.
+    queries:
+        Queries in priority order; consumed lazily, so pass a generator to
+        avoid formatting queries that are never sent.
+    workers:
+        Maximum concurrent queries.
+    url_key, title_key, snippet_key:
+        Keys of the URL, title and snippet fields in each item.
+    max_results:
+        Maximum number of results to return.
+    hits:
+        Optional dict that receives, for each query whose items were
+        collected, the number of new unique results it contributed.
+    """
+    # Insertion-ordered, so the URL keys double as the dedup set
+    accum: dict[str, RawSearchResult] = {}
+    if max_results <= 0:
+        return []
+    finished = 0
+
+    def ahead(in_flight: int) -> bool:
+        # held + in_flight * (held / finished) < max_results, without division
+        return finished > 0 and len(accum) * (finished + in_flight) < (
+            max_results * finished
+        )
+
+    def run(query: str) -> tuple[str, list[dict]]:
+        return query, search(query)
+
+    for query, items in prefetch(run, queries, workers=workers, ahead=ahead):
+        finished += 1
+        if hits is not None:
+            hits.setdefault(query, 0)
+        for item in items:
+            url = (item.get(url_key) or "").strip()
+            if not url or url in accum:
+                continue
+            accum[url] = RawSearchResult(
+                url=url,
+                title=(item.get(title_key) or "").strip(),
+                snippet=(item.get(snippet_key) or "").strip(),
+            )
+            if hits is not None:
+                hits[query] += 1
+            if len(accum) >= max_results:
+                return list(accum.values())
+
+    return list(accum.values())
 
 
 # ---------------------------------------------------------------------------
@@ -180,6 +486,7 @@ class GoogleSearchSource:
     ) -> None:
         self._config = config
         self._session = session or self._default_session()
+        self._page_cache: dict[str, list[dict]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -191,6 +498,8 @@ class GoogleSearchSource:
         keywords: list[str],
         categories: list[str],
         ats_domains: dict[str, list[str]] | None = None,
+        productivity: Mapping[str, float] | None = None,
+        query_hits: dict[str, int] | None = None,
     ) -> list[RawSearchResult]:
         """Run queries and return deduplicated search results.
 
@@ -203,7 +512,14 @@ class GoogleSearchSource:
         categories:
             Category names included in every query.
         ats_domains:
-            Optional ATS domain mapping passed to :func:`build_queries`.
+            Optional ATS domain mapping passed to :func:`iter_queries`.
+        productivity:
+            Optional past query productivity passed to :func:`iter_queries`,
+            so the most productive queries run first.
+        query_hits:
+            Optional dict that receives the new unique results each query
+            contributed (see :func:`collect_results`); feed it to
+            :func:`update_productivity`.
 
         Returns
         -------
@@ -211,52 +527,48 @@ class GoogleSearchSource:
             Unique results across all queries, capped at
             ``config.max_results`` total entries.
         """
-        queries = build_queries(
-            locations, keywords, categories, ats_domains=ats_domains
+        queries = iter_queries(
+            locations,
+            keywords,
+            categories,
+            ats_domains=ats_domains,
+            productivity=productivity,
         )
 
-        seen_urls: set[str] = set()
-        results: list[RawSearchResult] = []
-
-        for q in queries:
-            if len(results) >= self._config.max_results:
-                break
-            for item in self._paginate(q):
-                url = item.get("link", "").strip()
-                if not url or url in seen_urls:
-                    continue
-                seen_urls.add(url)
-                results.append(
-                    RawSearchResult(
-                        url=url,
-                        title=item.get("title", "").strip(),
-                        snippet=item.get("snippet", "").strip(),
-                    )
-                )
-                if len(results) >= self._config.max_results:
-                    break
-
-        return results
+        return collect_results(
+            self._paginate,
+            queries,
+            workers=_QUERY_WORKERS,
+            url_key="link",
+            title_key="title",
+            snippet_key="snippet",
+            max_results=self._config.max_results,
+            hits=query_hits,
+        )
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _paginate(self, query: str) -> list[dict]:
-        """Yield all items for *query*, paginating up to ``max_results``."""
-        items: list[dict] = []
-        start = 1
-
-        while start <= _MAX_START and len(items) < self._config.max_results:
-            batch = self._search(query, start=start)
-            if not batch:
-                break
-            items.extend(batch)
-            if len(batch) < _PAGE_SIZE:
-                break  # last page
-            start += _PAGE_SIZE
+        """Return all items for *query*, paginating up to ``max_results``.
 
-        return items[: self._config.max_results]
+        Results are memoised per query for the lifetime of the source, so a
+        query repeated within a run (e.g. a duplicated location) costs no
+        further API calls.
+        """
+        cached = self._page_cache.get(query)
+        if cached is not None:
+            return cached
+        items = fetch_pages(
+            lambda start: self._search(query, start=start),
+            range(1, _MAX_START + 1, _PAGE_SIZE),
+            page_size=_PAGE_SIZE,
+            max_results=self._config.max_results,
+        )
+        if items:  # leave failed or empty queries to be retried
+            self._page_cache[query] = items
+        return items
 
     def _search(self, query: str, start: int = 1) -> list[dict]:
         """Execute a single API request; return the ``items`` list or []."""
@@ -292,6 +604,8 @@ class GoogleSearchSource:
 
     @staticmethod
     def _default_session() -> requests.Session:
-        session = requests.Session()
-        session.headers.update({"Accept": "application/json"})
-        return session
+        return api_session(
+            {"Accept": "application/json"},
+            page_workers=_PAGE_WORKERS,
+            query_workers=_QUERY_WORKERS,
+        )
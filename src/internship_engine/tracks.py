@@ -10,7 +10,9 @@ postings meeting the minimum threshold are kept.
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -32,6 +34,12 @@ class Track(str, Enum):
     ALL = "all"
 
 
+# Bound once: ``Track.ALL`` goes through the enum metaclass on every access,
+# which costs several times the comparison itself.  ``==`` (not ``is``) keeps
+# plain ``"all"`` strings working.
+_ALL = Track.ALL
+
+
 # ---------------------------------------------------------------------------
 # Keyword lists
 # ---------------------------------------------------------------------------
@@ -175,21 +183,64 @@ _PENALTY: int = 3  # points deducted per negative keyword hit
 
 
 # ---------------------------------------------------------------------------
-# Keyword matching helper
+# Keyword matching helpers
 # ---------------------------------------------------------------------------
 
+_WORD_RE = re.compile(r"\w+")
+_PLAIN_WORD_RE = re.compile(r"\w+\Z")
 
-def _kw_match(keyword: str, text: str) -> bool:
-    """Check whether *keyword* appears in *text* as a meaningful match.
 
-    * Single-word keywords use ``\\b`` word-boundary anchors so that e.g.
-      ``"data"`` does **not** match inside ``"candidate"``.
-    * Multi-word phrases (containing a space) use plain substring matching,
-      which is already precise enough.
+@dataclass(frozen=True)
+class _KeywordSet:
+    """One keyword list split by how each entry is matched.
+
+    Single-word keywords must match on word boundaries, so that e.g.
+    ``"data"`` does **not** match inside ``"candidate"``.  One made only of
+    word characters matches between ``\\b`` anchors exactly when it equals
+    one of the text's ``\\w+`` runs; those keywords are therefore tested
+    together by one set intersection with the text's words.  Multi-word
+    phrases (containing a space) are plain substring tests.  The remaining
+    single words carry punctuation (``"c++"``, ``"ci/cd"``) and are searched
+    for with a regex that only requires no word character on either side.
     """
-    if " " in keyword:
-        return keyword in text
-    return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
+
+    words: frozenset[str]
+    phrases: tuple[str, ...]
+    patterns: tuple[tuple[str, re.Pattern[str]], ...] = ()
+
+    @classmethod
+    def of(cls, keywords: list[str]) -> _KeywordSet:
+        return cls(
+            words=frozenset(kw for kw in keywords if _PLAIN_WORD_RE.match(kw)),
+            phrases=tuple(kw for kw in keywords if " " in kw),
+            patterns=tuple(
+                (kw, re.compile(rf"(?<!\w){re.escape(kw)}(?!\w)"))
+                for kw in keywords
+                if " " not in kw and not _PLAIN_WORD_RE.match(kw)
+            ),
+        )
+
+    def hits(self, text: str, words: set[str]) -> set[str]:
+        """Return the keywords found in *text*.
+
+        *words* must be the set of ``\\w+`` runs of *text*.
+        """
+        found = words & self.words
+        found.update(kw for kw in self.phrases if kw in text)
+        found.update(kw for kw, pattern in self.patterns if pattern.search(text))
+        return found
+
+
+# Compiled once at import: track -> ((keywords, title points, description
+# points), ...) for the strong then the weak list
+_TRACK_KEYWORD_SETS: dict[Track, tuple[tuple[_KeywordSet, int, int], ...]] = {
+    track: (
+        (_KeywordSet.of(kws["strong"]), 10, 5),
+        (_KeywordSet.of(kws["weak"]), 3, 1),
+    )
+    for track, kws in _TRACK_KEYWORDS.items()
+}
+_NEGATIVE_KEYWORD_SET = _KeywordSet.of(_NEGATIVE_KEYWORDS)
 
 
 # ---------------------------------------------------------------------------
@@ -197,63 +248,156 @@ def _kw_match(keyword: str, text: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True)
+class _PreparedText:
+    """A posting's lower-cased text and word sets, shared across tracks.
+
+    Track scores are memoised on the instance as they are computed, so a
+    cached instance (see :func:`_prepare_text`) is scored at most once per
+    track.
+    """
+
+    title: str
+    desc: str
+    full_text: str
+    title_words: set[str]
+    desc_words: set[str]
+    _scores: dict[Track, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def score(self, track: Track) -> int:
+        """Return :func:`_score_prepared` for *track*, computing it once."""
+        score = self._scores.get(track)
+        if score is None:
+            score = self._scores[track] = _score_prepared(self, track)
+        return score
+
+    @cached_property
+    def penalty(self) -> int:
+        """Track-independent negative-keyword deduction.
+
+        Only computed once some track has a positive score to deduct from.
+        """
+        negative_hits = _NEGATIVE_KEYWORD_SET.hits(
+            self.full_text, self.title_words | self.desc_words
+        )
+        return _PENALTY * len(negative_hits)
+
+
+def _prepare(posting: JobPosting) -> _PreparedText:
+    """Tokenise *posting* once for scoring against any track.
+
+    The lower-cased text comes from the posting's cached derived fields, so
+    it is computed once per posting, and the prepared text is cached by that
+    text, so it is tokenised and scored once however often it is scored.
+    """
+    return _prepare_text(
+        posting.title_lower, posting.description_lower, posting.search_text
+    )
+
+
+@lru_cache(maxsize=1024)
+def _prepare_text(title: str, desc: str, full_text: str) -> _PreparedText:
+    """Tokenise already lower-cased text; see :func:`_prepare`.
+
+    Cached by the text: the same listing is often syndicated to several
+    boards under different URLs, and those copies survive deduplication
+    but share one prepared text and its memoised scores.
+    """
+    return _PreparedText(
+        title=title,
+        desc=desc,
+        full_text=full_text,
+        title_words=set(_WORD_RE.findall(title)),
+        desc_words=set(_WORD_RE.findall(desc)),
+    )
+
+
+def _score_prepared(text: _PreparedText, track: Track) -> int:
+    """Score prepared *text* against a non-ALL *track*."""
+    score = 0
+    for kws, in_title, in_desc in _TRACK_KEYWORD_SETS[track]:
+        title_hits = kws.hits(text.title, text.title_words)
+        desc_hits = kws.hits(text.desc, text.desc_words) - title_hits
+        score += in_title * len(title_hits) + in_desc * len(desc_hits)
+    if not score:
+        return 0  # penalties cannot lower a zero score
+    score -= text.penalty
+    return score if score > 0 else 0
+
+
 def score_track(posting: JobPosting, track: Track) -> int:
     """Score *posting* against *track*'s keyword lists.
 
     Returns a non-negative integer; higher means stronger match.
     ``Track.ALL`` always returns 1 (unconditional pass).
+
+    Each keyword counts once: in the title if it appears there, otherwise
+    in the description.  Each negative keyword found anywhere deducts
+    :data:`_PENALTY`.
     """
-    if track == Track.ALL:
+    if track == _ALL:
         return 1
+    return _prepare(posting).score(track)
 
-    kws = _TRACK_KEYWORDS[track]
-    title = posting.title.lower()
-    desc = (posting.description or "").lower()
-    full_text = title + " " + desc
 
-    score = 0
-    for kw in kws.get("strong", []):
-        if _kw_match(kw, title):
-            score += 10
-        elif _kw_match(kw, desc):
-            score += 5
+def score_all_tracks(posting: JobPosting) -> dict[Track, int]:
+    """Return a score for every non-ALL track.
 
-    for kw in kws.get("weak", []):
-        if _kw_match(kw, title):
-            score += 3
-        elif _kw_match(kw, desc):
-            score += 1
+    The posting is lower-cased and tokenised once for all tracks.
+    """
+    text = _prepare(posting)
+    return {t: text.score(t) for t in _TRACK_KEYWORD_SETS}
 
-    for kw in _NEGATIVE_KEYWORDS:
-        if _kw_match(kw, full_text):
-            score -= _PENALTY
 
-    return max(0, score)
+# Every subset of the scored tracks, indexed by bitmask (bit i = i-th track)
+_SCORED_TRACKS: tuple[Track, ...] = tuple(_TRACK_KEYWORD_SETS)
+_TRACKS_BY_MASK: tuple[tuple[Track, ...], ...] = tuple(
+    tuple(t for i, t in enumerate(_SCORED_TRACKS) if mask >> i & 1)
+    for mask in range(1 << len(_SCORED_TRACKS))
+)
+_LABEL_BY_MASK: tuple[str, ...] = tuple(
+    "|".join(t.value for t in tracks) for tracks in _TRACKS_BY_MASK
+)
 
 
-def score_all_tracks(posting: JobPosting) -> dict[Track, int]:
-    """Return a score for every non-ALL track."""
-    return {t: score_track(posting, t) for t in Track if t != Track.ALL}
+def _match_mask(posting: JobPosting, min_score: int) -> int:
+    """Return the bitmask of scored tracks for which *posting* meets *min_score*."""
+    text = _prepare(posting)
+    mask = 0
+    for i, track in enumerate(_SCORED_TRACKS):
+        if text.score(track) >= min_score:
+            mask |= 1 << i
+    return mask
 
 
-def best_tracks(
+def classify(
     posting: JobPosting, *, min_score: int = _MIN_SCORE
-) -> list[Track]:
+) -> tuple[tuple[Track, ...], str]:
+    """Return the matching tracks of *posting* and their label in one pass.
+
+    Equivalent to ``(tuple(best_tracks(p)), track_match_label(p))`` but
+    scores the posting once.  A posting passes :func:`filter_by_track` for a
+    non-ALL track exactly when that track is in the returned tuple (with the
+    same *min_score*), so callers that label postings can filter them too
+    without scoring again.
+    """
+    mask = _match_mask(posting, min_score)
+    return _TRACKS_BY_MASK[mask], _LABEL_BY_MASK[mask]
+
+
+def best_tracks(posting: JobPosting, *, min_score: int = _MIN_SCORE) -> list[Track]:
     """Return the tracks for which *posting* meets *min_score*."""
-    return [t for t, s in score_all_tracks(posting).items() if s >= min_score]
+    return list(_TRACKS_BY_MASK[_match_mask(posting, min_score)])
 
 
-def track_match_label(
-    posting: JobPosting, *, min_score: int = _MIN_SCORE
-) -> str:
+def track_match_label(posting: JobPosting, *, min_score: int = _MIN_SCORE) -> str:
     """Return a pipe-separated string of matching track names.
 
     Returns ``""`` when no track matches.  Example: ``"cyber|it"``.
     """
-    matched = best_tracks(posting, min_score=min_score)
-    if not matched:
-        return ""
-    return "|".join(t.value for t in matched)
+    return _LABEL_BY_MASK[_match_mask(posting, min_score)]
 
 
 # ---------------------------------------------------------------------------
@@ -271,7 +415,7 @@ def filter_by_track(
 
     ``Track.ALL`` is a no-op — all postings are returned unchanged.
     """
-    if track == Track.ALL:
+    if track == _ALL:
         return postings
     return [p for p in postings if score_track(p, track) >= min_score]
 
@@ -307,7 +451,7 @@ def track_query_terms(track: Track) -> list[str]:
     Returns an empty list for ``Track.ALL`` (let the user's own keywords drive
     the query, or fall back to default internship terms).
     """
-    if track == Track.ALL:
+    if track == _ALL:
         return []
     template = _TRACK_QUERY_TEMPLATES.get(track, "")
     return [template] if template else []
@@ -8,7 +8,9 @@ import pytest
 import requests
 
 from internship_engine.active_check import (
+    _CHUNK_SIZE,
     ActiveCheckResult,
+    canonical_url,
     check_active,
     check_active_from_response,
 )
@@ -24,19 +26,23 @@ def _mock_session(status_code: int, text: str = "") -> MagicMock:
     resp = MagicMock()
     resp.status_code = status_code
     resp.text = text
+    resp.iter_content.side_effect = lambda *a, **kw: iter([text.encode()])
     session = MagicMock()
+    session.head.return_value = resp
     session.get.return_value = resp
     return session
 
 
 def _timeout_session() -> MagicMock:
     session = MagicMock()
+    session.head.side_effect = requests.exceptions.Timeout()
     session.get.side_effect = requests.exceptions.Timeout()
     return session
 
 
 def _error_session(msg: str = "connection refused") -> MagicMock:
     session = MagicMock()
+    session.head.side_effect = requests.exceptions.ConnectionError(msg)
     session.get.side_effect = requests.exceptions.ConnectionError(msg)
     return session
 
@@ -134,6 +140,31 @@ class TestClosedSignals:
         result = check_active(_URL, _mock_session(200, html))
         assert result.status == ActiveStatus.INACTIVE
 
+    def test_leftmost_signal_in_body_reported(self):
+        # "job closed" comes after "no longer available" in the signal table,
+        # but appears first in the page, so it is the one named
+        html = "<p>job closed — this role is no longer available</p>"
+        result = check_active(_URL, _mock_session(200, html))
+        assert result.reason == "closed signal: 'job closed'"
+
+    def test_signal_split_across_chunks_detected(self):
+        session = _mock_session(200)
+        session.get.return_value.iter_content.side_effect = lambda *a, **kw: iter(
+            [b"<p>This position has been", b" filled.</p>"]
+        )
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.INACTIVE
+
+    def test_response_closed_after_scan(self):
+        session = _mock_session(200, "<p>job closed</p>")
+        check_active(_URL, session)
+        session.get.return_value.close.assert_called_once()
+
+    def test_exact_signal_named_in_reason(self):
+        html = "<p>Sorry, this position is no longer available.</p>"
+        result = check_active(_URL, _mock_session(200, html))
+        assert result.reason == "closed signal: 'position is no longer available'"
+
 
 # ---------------------------------------------------------------------------
 # HTTP 200, no closed signals → ACTIVE
@@ -159,6 +190,56 @@ class TestActive:
         assert "no closed signals" in result.reason
 
 
+# ---------------------------------------------------------------------------
+# HEAD short-circuit
+# ---------------------------------------------------------------------------
+
+
+class TestHeadShortCircuit:
+    def test_gone_head_skips_get(self):
+        session = _mock_session(404)
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.INACTIVE
+        session.get.assert_not_called()
+
+    def test_ok_head_falls_through_to_get(self):
+        session = _mock_session(200, "<p>job closed</p>")
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.INACTIVE
+        session.get.assert_called_once()
+
+    @pytest.mark.parametrize("head_status", [403, 429, 500, 503])
+    def test_blocked_or_failing_head_is_judged_by_get(self, head_status):
+        session = _mock_session(200, "<p>Apply now</p>")
+        session.head.return_value = MagicMock(status_code=head_status)
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.ACTIVE
+        session.get.assert_called_once()
+
+    def test_head_not_allowed_falls_back_to_get(self):
+        session = _mock_session(200, "<p>Apply now</p>")
+        session.head.return_value = MagicMock(status_code=405)
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.ACTIVE
+        session.get.assert_called_once()
+
+    def test_head_error_returns_unknown_without_get(self):
+        session = _mock_session(200, "<p>Apply now</p>")
+        session.head.side_effect = requests.exceptions.ConnectionError("reset")
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.UNKNOWN
+        assert "request failed" in result.reason.lower()
+        session.get.assert_not_called()
+
+    def test_head_timeout_returns_unknown_without_get(self):
+        session = _mock_session(200, "<p>Apply now</p>")
+        session.head.side_effect = requests.exceptions.Timeout()
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.UNKNOWN
+        assert "timed out" in result.reason.lower()
+        session.get.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Network errors → UNKNOWN
 # ---------------------------------------------------------------------------
@@ -175,6 +256,15 @@ class TestNetworkErrors:
         assert result.status == ActiveStatus.UNKNOWN
         assert "request failed" in result.reason.lower()
 
+    def test_get_timeout_after_inconclusive_head_returns_unknown(self):
+        session = _timeout_session()
+        session.head.side_effect = None
+        session.head.return_value = MagicMock(status_code=405)
+        result = check_active(_URL, session)
+        assert result.status == ActiveStatus.UNKNOWN
+        assert "timed out" in result.reason.lower()
+        session.get.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # Unexpected 2xx (e.g. 201, 204) → UNKNOWN
@@ -209,6 +299,7 @@ class TestReturnType:
 
         with mock.patch("requests.Session") as MockSession:
             ms = MagicMock()
+            ms.head.side_effect = requests.exceptions.ConnectionError("refused")
             ms.get.side_effect = requests.exceptions.ConnectionError("refused")
             MockSession.return_value = ms
             result = check_active("https://example.com/job/99")
@@ -274,6 +365,11 @@ class TestCheckActiveFromResponse:
         result = check_active_from_response(200, "Position Has Been Filled")
         assert result.status == ActiveStatus.INACTIVE
 
+    def test_closed_signal_on_chunk_boundary(self):
+        html = "x" * (_CHUNK_SIZE - 5) + "job closed"
+        result = check_active_from_response(200, html)
+        assert result.status == ActiveStatus.INACTIVE
+
     # HTTP 200, no closed signals → ACTIVE
     def test_clean_page_returns_active(self):
         html = "<html><body><h1>Software Intern</h1></body></html>"
@@ -311,3 +407,27 @@ class TestCheckActiveFromResponse:
         pure_result = check_active_from_response(200, html)
         assert url_result.status == pure_result.status
         assert url_result.reason == pure_result.reason
+
+
+# ---------------------------------------------------------------------------
+# canonical_url — cache key normalisation
+# ---------------------------------------------------------------------------
+
+
+class TestCanonicalUrl:
+    def test_lowercases_scheme_and_host(self):
+        assert canonical_url("HTTPS://Jobs.Example.COM/Job/1") == (
+            "https://jobs.example.com/Job/1"
+        )
+
+    def test_strips_utm_and_tracking_params(self):
+        url = "https://x.com/job?id=7&utm_source=g&gclid=abc&gh_src=li"
+        assert canonical_url(url) == "https://x.com/job?id=7"
+
+    def test_drops_fragment(self):
+        assert canonical_url("https://x.com/job#apply") == "https://x.com/job"
+
+    def test_same_posting_same_key(self):
+        a = canonical_url("https://x.com/job/1?utm_medium=email")
+        b = canonical_url("https://X.com/job/1")
+        assert a == b
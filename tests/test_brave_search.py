@@ -7,15 +7,22 @@ All tests are network-free:
 
 from __future__ import annotations
 
+import math
 from unittest.mock import MagicMock
 
 import pytest
 
 from internship_engine.sources.brave_search import (
+    _BRAVE_URL,
+    _INITIAL_BACKOFF,
+    _MAX_RETRY_AFTER,
     _PAGE_SIZE,
+    _PAGE_WORKERS,
+    _QUERY_WORKERS,
     BraveSearchConfig,
     BraveSearchSource,
     _freshness_value,
+    _parse_retry_after,
 )
 from internship_engine.sources.google_search import RawSearchResult
 
@@ -77,6 +84,11 @@ class TestBraveSessionHeaders:
         session = BraveSearchSource._default_session("k")
         assert session.headers["Accept"] == "application/json"
 
+    def test_default_session_pools_concurrent_requests(self):
+        session = BraveSearchSource._default_session("k")
+        adapter = session.get_adapter(_BRAVE_URL)
+        assert adapter._pool_maxsize == _PAGE_WORKERS * _QUERY_WORKERS
+
 
 # ---------------------------------------------------------------------------
 # BraveSearchSource.fetch — result parsing
@@ -134,15 +146,30 @@ class TestBraveSearchSourceFetch:
         source.fetch(["New York", "Austin", "Boston"], [], [])
         assert session.get.call_count >= 3
 
+    def test_repeated_query_served_from_cache(self):
+        session = _mock_session(_make_web_results(1))
+        source = BraveSearchSource(_config(), session=session)
+        source.fetch(["Austin"], [], [])
+        source.fetch(["Austin"], [], [])
+        assert session.get.call_count == 1
+
+    def test_empty_query_result_not_cached(self):
+        session = _mock_session_empty()
+        source = BraveSearchSource(_config(), session=session)
+        source.fetch([], [], [])
+        source.fetch([], [], [])
+        assert session.get.call_count == 2
+
     def test_ats_domains_produces_more_queries(self):
         """When ats_domains is passed, more GET requests are made."""
         ats = {"greenhouse": ["boards.greenhouse.io"]}
         session = _mock_session(_make_web_results(1))
-        source = BraveSearchSource(_config(max_results=50), session=session)
-        source.fetch([], [], [])
+        BraveSearchSource(_config(max_results=50), session=session).fetch([], [], [])
         calls_without = session.get.call_count
 
+        # Fresh source: a reused one would serve the generic query from cache
         session.reset_mock()
+        source = BraveSearchSource(_config(max_results=50), session=session)
         source.fetch([], [], [], ats_domains=ats)
         calls_with = session.get.call_count
 
@@ -288,6 +315,79 @@ class TestBraveSearch429Retry:
         source = BraveSearchSource(_config(), session=session, sleep_fn=lambda _: None)
         assert source.fetch([], [], []) == []
 
+    def test_retry_after_seconds_honoured(self):
+        session = MagicMock()
+        resp_429 = MagicMock()
+        resp_429.status_code = 429
+        resp_429.headers = {"Retry-After": "2"}
+        resp_ok = MagicMock()
+        resp_ok.status_code = 200
+        resp_ok.json.return_value = {"web": {"results": _make_web_results(1)}}
+        session.get.side_effect = [resp_429, resp_ok]
+
+        sleep_calls = []
+        source = BraveSearchSource(
+            _config(), session=session, sleep_fn=lambda s: sleep_calls.append(s)
+        )
+        source.fetch([], [], [])
+        assert sleep_calls == [2.0]
+
+    @pytest.mark.parametrize("header", ["0", "0.2"])
+    def test_short_retry_after_never_undercuts_backoff(self, header):
+        session = MagicMock()
+        resp_429 = MagicMock()
+        resp_429.status_code = 429
+        resp_429.headers = {"Retry-After": header}
+        resp_ok = MagicMock()
+        resp_ok.status_code = 200
+        resp_ok.json.return_value = {"web": {"results": _make_web_results(1)}}
+        session.get.side_effect = [resp_429, resp_429, resp_ok]
+
+        sleep_calls = []
+        source = BraveSearchSource(
+            _config(), session=session, sleep_fn=lambda s: sleep_calls.append(s)
+        )
+        source.fetch([], [], [])
+        assert sleep_calls == [_INITIAL_BACKOFF, _INITIAL_BACKOFF * 2]
+
+    def test_malformed_retry_after_falls_back_to_backoff(self):
+        session = MagicMock()
+        resp_429 = MagicMock()
+        resp_429.status_code = 429
+        resp_429.headers = {"Retry-After": "nan"}
+        resp_ok = MagicMock()
+        resp_ok.status_code = 200
+        resp_ok.json.return_value = {"web": {"results": _make_web_results(1)}}
+        session.get.side_effect = [resp_429, resp_ok]
+
+        sleep_calls = []
+        source = BraveSearchSource(
+            _config(), session=session, sleep_fn=lambda s: sleep_calls.append(s)
+        )
+        assert len(source.fetch([], [], [])) == 1
+        assert len(sleep_calls) == 1
+        assert math.isfinite(sleep_calls[0])
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after("3") == 3.0
+
+    def test_http_date_in_the_past_clamps_to_zero(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_large_value_capped(self):
+        assert _parse_retry_after("86400") == _MAX_RETRY_AFTER
+
+    def test_surrounding_whitespace_ignored(self):
+        assert _parse_retry_after(" 7 ") == 7.0
+
+    @pytest.mark.parametrize(
+        "value", [None, "", "soon", 5, "nan", "inf", "1e3", "-5", "0.25", "٣"]
+    )
+    def test_absent_or_invalid_returns_none(self, value):
+        assert _parse_retry_after(value) is None
+
 
 # ---------------------------------------------------------------------------
 # Other error handling
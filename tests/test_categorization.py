@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from internship_engine.categorization import categorize
+import pytest
+
+from internship_engine.categorization import _CATEGORY_KEYWORDS, categorize
 from internship_engine.models import Category, JobPosting
 
 # ---------------------------------------------------------------------------
@@ -114,6 +116,11 @@ class TestCategorizeEdgeCases:
         # "Product Manager" should NOT fall through to SOFTWARE
         assert categorize(_posting("Product Manager Intern")) == Category.PRODUCT
 
+    def test_priority_independent_of_text_order(self):
+        # SOFTWARE keyword appears first in the text, DATA still wins
+        p = _posting("Backend Intern", description="Build analytics pipelines.")
+        assert categorize(p) == Category.DATA
+
     def test_empty_title_and_description(self):
         p = _posting("", description="")
         assert categorize(p) == Category.OTHER
@@ -175,3 +182,25 @@ class TestCategorizeFalsePositives:
 
     def test_devops_still_software(self):
         assert categorize(_posting("DevOps Intern")) == Category.SOFTWARE
+
+    def test_hyphenated_keyword_needs_word_boundaries(self):
+        """'front-end' matches whole words only, like single-word keywords."""
+        assert categorize(_posting("Front-End Intern")) == Category.SOFTWARE
+        assert categorize(_posting("Front-Ends Intern")) == Category.OTHER
+
+    def test_punctuation_separates_words(self):
+        """'seo' still matches when followed by punctuation."""
+        assert categorize(_posting("SEO/SEM Intern")) == Category.MARKETING
+
+
+# ---------------------------------------------------------------------------
+# Compiled keyword matchers
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("category", "keyword"),
+    [(cat, kw) for cat, kws in _CATEGORY_KEYWORDS.items() for kw in kws],
+)
+def test_every_registered_keyword_maps_to_its_category(category, keyword):
+    assert categorize(_posting(keyword.title())) == category
@@ -6,6 +6,7 @@ import pytest
 
 from internship_engine.deduplication import (
     DuplicateFilter,
+    append_hashes,
     compute_hash,
     load_hashes,
     save_hashes,
@@ -177,6 +178,13 @@ class TestDuplicateFilterFilterNew:
     def test_empty_input_returns_empty(self):
         assert DuplicateFilter().filter_new([]) == []
 
+    def test_shares_state_with_is_new(self):
+        df = DuplicateFilter()
+        p = _posting()
+        df.filter_new([p])
+        assert df.is_new(p) is False
+        assert df.seen_count == 1
+
 
 # ---------------------------------------------------------------------------
 # DuplicateFilter — initial_hashes seeding
@@ -229,6 +237,19 @@ class TestDuplicateFilterHashes:
         assert snapshot_before == frozenset()  # snapshot unchanged
 
 
+class TestDuplicateFilterNewHashes:
+    def test_excludes_initial_hashes(self):
+        df = DuplicateFilter(initial_hashes={"a" * 64})
+        assert df.new_hashes() == ()
+
+    def test_records_new_hashes_in_order(self):
+        df = DuplicateFilter()
+        p1 = _posting(posting_url="https://example.com/1")
+        p2 = _posting(posting_url="https://example.com/2")
+        df.filter_new([p1, p2, p1])
+        assert df.new_hashes() == (compute_hash(p1), compute_hash(p2))
+
+
 # ---------------------------------------------------------------------------
 # load_hashes / save_hashes — file persistence
 # ---------------------------------------------------------------------------
@@ -276,3 +297,35 @@ class TestSaveHashes:
         save_hashes(f, original)
         loaded = load_hashes(f)
         assert loaded == set(original)
+
+    def test_overwrite_leaves_no_temp_file(self, tmp_path):
+        f = tmp_path / "hashes.txt"
+        save_hashes(f, frozenset({"a" * 64}))
+        save_hashes(f, frozenset({"b" * 64}))
+        assert load_hashes(f) == {"b" * 64}
+        assert [p.name for p in tmp_path.iterdir()] == ["hashes.txt"]
+
+
+class TestAppendHashes:
+    def test_creates_file_and_parent_dirs(self, tmp_path):
+        f = tmp_path / "sub" / "hashes.txt"
+        append_hashes(f, ("a" * 64,))
+        assert load_hashes(f) == {"a" * 64}
+
+    def test_appends_to_existing_file(self, tmp_path):
+        f = tmp_path / "hashes.txt"
+        save_hashes(f, frozenset({"a" * 64}))
+        append_hashes(f, ("b" * 64, "c" * 64))
+        assert load_hashes(f) == {"a" * 64, "b" * 64, "c" * 64}
+
+    def test_missing_trailing_newline_not_merged(self, tmp_path):
+        f = tmp_path / "hashes.txt"
+        f.write_text("a" * 64, encoding="utf-8")  # no final newline
+        append_hashes(f, ("b" * 64,))
+        assert f.read_text(encoding="utf-8") == f"{'a' * 64}\n{'b' * 64}\n"
+        assert load_hashes(f) == {"a" * 64, "b" * 64}
+
+    def test_empty_input_does_not_create_file(self, tmp_path):
+        f = tmp_path / "hashes.txt"
+        append_hashes(f, ())
+        assert not f.exists()
@@ -7,13 +7,25 @@ All tests are purely in-process; no network calls are made.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
 
 from internship_engine.extractor import (
     Extractor,
+    _extract_job_posting,
+    _HostThrottledAdapter,
     _is_job_posting,
+    _make_session,
     _parse_date,
+    _parse_date_str,
     parse_html,
 )
 from internship_engine.models import DatePostedConfidence
@@ -412,6 +424,38 @@ class TestParseHtmlMalformedJsonLd:
         assert r.title == "Valid Intern"
 
 
+# ---------------------------------------------------------------------------
+# parse_html — locating JSON-LD script blocks
+# ---------------------------------------------------------------------------
+
+
+class TestParseHtmlScriptLocation:
+    def test_script_inside_nested_markup_found(self):
+        html = (
+            "<html><body>"
+            + "<div><section><p>filler</p>" * 50
+            + '<script type="application/ld+json">'
+            '{"@type": "JobPosting", "title": "Nested Intern"}</script>'
+            + "</section></div>" * 50
+            + "</body></html>"
+        )
+        assert parse_html(html).title == "Nested Intern"
+
+    def test_attribute_order_quotes_and_case_tolerated(self):
+        html = (
+            "<html><head><SCRIPT id='ld' TYPE='Application/LD+JSON'>"
+            '{"@type": "JobPosting", "title": "Upper Intern"}</SCRIPT></head></html>'
+        )
+        assert parse_html(html).title == "Upper Intern"
+
+    def test_other_script_types_ignored(self):
+        html = (
+            '<script type="text/javascript">var t = "application/ld+json";'
+            '</script><script>{"@type": "JobPosting", "title": "Nope"}</script>'
+        )
+        assert parse_html(html).title == ""
+
+
 # ---------------------------------------------------------------------------
 # parse_html — empty / blocked body
 # ---------------------------------------------------------------------------
@@ -486,6 +530,12 @@ class TestParseDateFunction:
         assert d is None
         assert c == DatePostedConfidence.UNKNOWN
 
+    def test_surrounding_whitespace_shares_cache_entry(self):
+        _parse_date_str.cache_clear()
+        _parse_date("2024-06-01")
+        _parse_date("  2024-06-01\n")
+        assert _parse_date_str.cache_info().hits == 1
+
 
 # ---------------------------------------------------------------------------
 # Extractor.fetch_and_extract — mock session tests
@@ -495,25 +545,36 @@ class TestParseDateFunction:
 _TEST_URL = "https://example.com/job"
 
 
+@dataclass
+class _FakeResponse:
+    """Just the parts of ``requests.Response`` the extractor reads."""
+
+    status_code: int
+    text: str
+    url: str
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise HTTPError(response=self)
+
+
+@dataclass
+class _FakeSession:
+    """A ``requests.Session`` stand-in whose GET always returns *response*."""
+
+    response: _FakeResponse
+
+    def get(self, url: str, **kwargs: object) -> _FakeResponse:
+        return self.response
+
+
 def _mock_session(
     status_code: int = 200,
     text: str = _FULL_POSTING_HTML,
     url: str = _TEST_URL,
-) -> MagicMock:
-    """Build a mock requests.Session whose GET returns the given response."""
-    session = MagicMock()
-    response = MagicMock()
-    response.status_code = status_code
-    response.text = text
-    response.url = url
-    if status_code >= 400:
-        from requests.exceptions import HTTPError
-
-        response.raise_for_status.side_effect = HTTPError(response=response)
-    else:
-        response.raise_for_status.return_value = None
-    session.get.return_value = response
-    return session
+) -> _FakeSession:
+    """Build a fake requests.Session whose GET returns the given response."""
+    return _FakeSession(_FakeResponse(status_code=status_code, text=text, url=url))
 
 
 class TestExtractorFetchAndExtract:
@@ -563,6 +624,10 @@ class TestExtractorFetchAndExtract:
         result = ext.fetch_and_extract("https://example.com/job")
         assert result.blocked is False
 
+    def test_session_property_exposes_injected_session(self):
+        session = _mock_session()
+        assert Extractor(session=session).session is session
+
 
 # ---------------------------------------------------------------------------
 # _is_job_posting — flexible @type matching
@@ -601,6 +666,29 @@ class TestIsJobPosting:
         assert _is_job_posting(42) is False
 
 
+# ---------------------------------------------------------------------------
+# _extract_job_posting — traversal order
+# ---------------------------------------------------------------------------
+
+
+class TestExtractJobPosting:
+    def test_first_match_in_document_order(self):
+        first = {"@type": "JobPosting", "title": "First"}
+        second = {"@type": "JobPosting", "title": "Second"}
+        data = [{"@graph": [{"@type": "WebPage"}, first]}, second]
+        assert _extract_job_posting(data) is first
+
+    def test_deeply_nested_lists(self):
+        posting = {"@type": "JobPosting"}
+        data: object = posting
+        for _ in range(2000):
+            data = [data]
+        assert _extract_job_posting(data) is posting
+
+    def test_non_list_graph_ignored(self):
+        assert _extract_job_posting({"@graph": {"@type": "JobPosting"}}) is None
+
+
 # ---------------------------------------------------------------------------
 # parse_html — @type variant detection
 # ---------------------------------------------------------------------------
@@ -754,3 +842,59 @@ class TestFetchResult:
         """parse_html is pure — it never produces a FetchResult."""
         result = parse_html(_FULL_POSTING_HTML)
         assert result.fetch_result is None
+
+
+# ---------------------------------------------------------------------------
+# Session factory — per-host throttling
+# ---------------------------------------------------------------------------
+
+
+class TestHostThrottledAdapter:
+    def _peak_concurrency(self, urls: list[str], max_per_host: int) -> int:
+        adapter = _HostThrottledAdapter(max_per_host=max_per_host)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fake_send(self, request, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+
+        with patch.object(HTTPAdapter, "send", fake_send):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda u: adapter.send(MagicMock(url=u)), urls))
+        return state["peak"]
+
+    def test_caps_concurrency_for_single_host(self):
+        urls = [f"https://boards.example.com/job/{i}" for i in range(16)]
+        assert self._peak_concurrency(urls, max_per_host=2) <= 2
+
+    def test_different_hosts_run_in_parallel(self):
+        urls = [f"https://host{i}.example.com/job" for i in range(8)]
+        assert self._peak_concurrency(urls, max_per_host=1) > 1
+
+    def test_streamed_response_holds_slot_until_closed(self):
+        adapter = _HostThrottledAdapter(max_per_host=1)
+
+        def fake_send(self, request, **kwargs):
+            response = requests.Response()
+            response.raw = MagicMock()
+            return response
+
+        with patch.object(HTTPAdapter, "send", fake_send):
+            response = adapter.send(MagicMock(url="https://boards.example.com/a"))
+        slot = adapter._slot("boards.example.com")
+        assert not slot.acquire(blocking=False)
+        response.close()
+        assert slot.acquire(blocking=False)
+
+    def test_default_session_uses_throttled_adapter(self):
+        session = _make_session()
+        assert isinstance(session.get_adapter("https://x.com"), _HostThrottledAdapter)
+
+    def test_default_session_retries_head_requests(self):
+        adapter = _make_session().get_adapter("https://x.com")
+        assert "HEAD" in adapter.max_retries.allowed_methods
@@ -1,20 +1,37 @@
 """Unit tests for internship_engine.sources.google_search.
 
 All tests are network-free:
-- build_queries() is a pure function tested directly.
-- GoogleSearchSource is tested by injecting a mock requests.Session.
+- build_queries() / iter_queries() are pure functions tested directly.
+- GoogleSearchSource is tested with a real requests.Session whose calls are
+  intercepted by the ``responses`` library.
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import threading
+
+import pytest
+import requests
+import responses
+from requests.exceptions import Timeout
 
 from internship_engine.sources.google_search import (
+    _CSE_URL,
+    _PAGE_WORKERS,
+    _QUERY_WORKERS,
     ATS_DOMAINS,
     GoogleSearchConfig,
     GoogleSearchSource,
     RawSearchResult,
+    api_session,
     build_queries,
+    collect_results,
+    fetch_pages,
+    iter_queries,
+    load_productivity,
+    prefetch,
+    save_productivity,
+    update_productivity,
 )
 
 # ---------------------------------------------------------------------------
@@ -30,30 +47,33 @@ def _config(max_results: int = 10) -> GoogleSearchConfig:
     )
 
 
-def _make_items(n: int, url_prefix: str = "https://example.com/job/") -> list[dict]:
+_JOB_URL_PREFIX = "https://example.com/job/"
+
+
+def _make_items(n: int, url_prefix: str = _JOB_URL_PREFIX) -> list[dict]:
     return [
         {"title": f"Job {i}", "link": f"{url_prefix}{i}", "snippet": f"Snippet {i}"}
         for i in range(1, n + 1)
     ]
 
 
-def _mock_session(items: list[dict]) -> MagicMock:
-    """Return a session whose GET always returns an API response with *items*."""
-    session = MagicMock()
-    response = MagicMock()
-    response.raise_for_status.return_value = None
-    response.json.return_value = {"items": items}
-    session.get.return_value = response
-    return session
+@pytest.fixture
+def cse():
+    """Intercept Custom Search API calls made through a real requests.Session."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
 
 
-def _mock_session_empty() -> MagicMock:
-    session = MagicMock()
-    response = MagicMock()
-    response.raise_for_status.return_value = None
-    response.json.return_value = {}  # no "items" key
-    session.get.return_value = response
-    return session
+def _serve(rsps: responses.RequestsMock, items: list[dict] | None = None, **kwargs):
+    """Answer every CSE GET with *items* and return a real session to inject.
+
+    ``items=None`` serves a body with no ``"items"`` key; extra *kwargs*
+    (``status``, ``body``) are passed to :meth:`responses.RequestsMock.add`.
+    """
+    if "body" not in kwargs:
+        kwargs["json"] = {} if items is None else {"items": items}
+    rsps.add(responses.GET, _CSE_URL, **kwargs)
+    return requests.Session()
 
 
 # ---------------------------------------------------------------------------
@@ -77,15 +97,17 @@ class TestBuildQueries:
         queries = build_queries([], ["Python"], ["software"])
         assert len(queries) == 1
 
-    def test_keywords_included(self):
-        queries = build_queries([], ["Python", "Django"], [])
-        assert "Python" in queries[0]
-        assert "Django" in queries[0]
-
-    def test_categories_included(self):
-        queries = build_queries([], [], ["software", "data"])
-        assert "software" in queries[0]
-        assert "data" in queries[0]
+    @pytest.mark.parametrize(
+        ("keywords", "categories", "expected"),
+        [
+            (["Python", "Django"], [], ["Python", "Django"]),
+            ([], ["software", "data"], ["software", "data"]),
+        ],
+        ids=["keywords", "categories"],
+    )
+    def test_tokens_included(self, keywords, categories, expected):
+        query = build_queries([], keywords, categories)[0]
+        assert all(token in query for token in expected)
 
     def test_default_terms_included(self):
         queries = build_queries([], [], [])
@@ -180,9 +202,7 @@ class TestBuildQueriesAts:
             assert "internship" in q.lower() or "intern" in q.lower()
 
     def test_ats_with_locations_produces_cross_product(self):
-        queries = build_queries(
-            ["NYC", "Austin"], [], [], ats_domains=_TINY_ATS
-        )
+        queries = build_queries(["NYC", "Austin"], [], [], ats_domains=_TINY_ATS)
         ats_qs = [q for q in queries if "site:" in q]
         generic_qs = [q for q in queries if "site:" not in q]
         # 2 domains × 2 locations = 4 ATS queries
@@ -191,9 +211,7 @@ class TestBuildQueriesAts:
         assert len(generic_qs) == 2
 
     def test_ats_with_keywords_preserves_keywords(self):
-        queries = build_queries(
-            [], ["cybersecurity"], [], ats_domains=_TINY_ATS
-        )
+        queries = build_queries([], ["cybersecurity"], [], ats_domains=_TINY_ATS)
         for q in queries:
             assert "cybersecurity" in q
 
@@ -204,104 +222,382 @@ class TestBuildQueriesAts:
         assert "smartrecruiters" in ATS_DOMAINS
 
 
+# ---------------------------------------------------------------------------
+# iter_queries — lazy variant
+# ---------------------------------------------------------------------------
+
+
+class TestIterQueries:
+    def test_same_order_as_build_queries(self):
+        args = (["NYC", "Austin"], ["python"], ["software"])
+        assert list(iter_queries(*args, ats_domains=_TINY_ATS)) == build_queries(
+            *args, ats_domains=_TINY_ATS
+        )
+
+    def test_yields_lazily(self):
+        queries = iter_queries(["NYC"], [], [], ats_domains=_TINY_ATS)
+        assert "site:" in next(queries)
+
+    def test_productivity_orders_queries(self):
+        scores = {"internship intern Boston": 5.0, "internship intern NYC": 1.0}
+        queries = build_queries(
+            ["NYC", "Austin", "Boston"], [], [], productivity=scores
+        )
+        assert [q.split()[-1] for q in queries] == ["Boston", "NYC", "Austin"]
+
+    def test_productivity_keeps_ats_first(self):
+        scores = {
+            "internship intern Austin site:boards.greenhouse.io": 3.0,
+            "internship intern Austin": 0.5,
+            "internship intern NYC": 2.0,
+        }
+        queries = build_queries(
+            ["NYC", "Austin"], [], [], ats_domains=_TINY_ATS, productivity=scores
+        )
+        assert queries == [
+            "internship intern Austin site:boards.greenhouse.io",
+            "internship intern NYC site:boards.greenhouse.io",
+            "internship intern NYC site:jobs.lever.co",
+            "internship intern Austin site:jobs.lever.co",
+            "internship intern NYC",
+            "internship intern Austin",
+        ]
+
+
+class TestUpdateProductivity:
+    def test_decays_queries_that_ran(self):
+        updated = update_productivity({"a": 8.0, "b": 4.0}, {"a": 1, "c": 3})
+        assert updated == {"a": 5.0, "b": 4.0, "c": 3.0}
+
+    def test_unproductive_query_sinks_below_a_steady_one(self):
+        scores = {"was-good": 20.0, "steady": 4.0}
+        for _ in range(3):
+            scores = update_productivity(scores, {"was-good": 0, "steady": 4})
+        assert scores["was-good"] < scores["steady"]
+
+
+class TestProductivityFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "nested" / "stats.json"
+        save_productivity(path, {"NYC": 4.5, "Austin": 0.0})
+        assert load_productivity(path) == {"NYC": 4.5, "Austin": 0.0}
+        assert not path.with_name("stats.json.tmp").exists()
+
+    def test_unwritable_path_logs_instead_of_raising(self, tmp_path, caplog):
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")  # a file where a dir must go
+        save_productivity(blocker / "stats.json", {"NYC": 1})
+        assert "Could not write productivity file" in caplog.text
+
+    def test_missing_file_is_empty(self, tmp_path):
+        assert load_productivity(tmp_path / "absent.json") == {}
+
+    def test_corrupt_file_is_empty(self, tmp_path):
+        path = tmp_path / "stats.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert load_productivity(path) == {}
+
+    def test_non_numeric_scores_dropped(self, tmp_path):
+        path = tmp_path / "stats.json"
+        path.write_text('{"NYC": 2, "Austin": "x", "LA": true}', encoding="utf-8")
+        assert load_productivity(path) == {"NYC": 2.0}
+
+
+# ---------------------------------------------------------------------------
+# collect_results — shared dedup / cap
+# ---------------------------------------------------------------------------
+
+
+def _collect(pages: dict[str, list[dict]], max_results=10, workers=1):
+    return collect_results(
+        pages.__getitem__,
+        pages,
+        workers=workers,
+        url_key="link",
+        title_key="title",
+        snippet_key="snippet",
+        max_results=max_results,
+    )
+
+
+class TestCollectResults:
+    def test_dedups_stripped_urls_across_pages(self):
+        pages = {"a": _make_items(2), "b": [{"link": " https://example.com/job/1 "}]}
+        assert [r.url for r in _collect(pages)] == [
+            "https://example.com/job/1",
+            "https://example.com/job/2",
+        ]
+
+    def test_missing_and_null_fields_tolerated(self):
+        pages = {"a": [{"link": None}, {"link": "https://x.com", "title": None}]}
+        results = _collect(pages)
+        assert results == [RawSearchResult(url="https://x.com", title="", snippet="")]
+
+    def test_hits_count_new_unique_results_per_query(self):
+        pages = {
+            "a": _make_items(3),
+            "b": _make_items(4),  # 1-3 already held via "a"
+            "c": [],
+        }
+        hits: dict[str, int] = {}
+        collect_results(
+            pages.__getitem__,
+            pages,
+            workers=1,
+            url_key="link",
+            title_key="title",
+            snippet_key="snippet",
+            max_results=10,
+            hits=hits,
+        )
+        assert hits == {"a": 3, "b": 1, "c": 0}
+
+    def test_stops_pulling_queries_once_full(self):
+        pulled: list[str] = []
+
+        def search(query: str) -> list[dict]:
+            pulled.append(query)
+            return _make_items(5, url_prefix=f"https://example.com/{query}/")
+
+        results = collect_results(
+            search,
+            iter(["q0", "q1", "q2"]),
+            workers=1,
+            url_key="link",
+            title_key="title",
+            snippet_key="snippet",
+            max_results=5,
+        )
+        assert len(results) == 5
+        assert pulled == ["q0"]
+
+    def test_lookahead_stops_when_in_flight_queries_should_fill(self):
+        pulled: list[str] = []
+
+        def search(query: str) -> list[dict]:
+            pulled.append(query)
+            return _make_items(10, url_prefix=f"https://example.com/{query}/")
+
+        results = collect_results(
+            search,
+            (f"q{i}" for i in range(10)),
+            workers=4,
+            url_key="link",
+            title_key="title",
+            snippet_key="snippet",
+            max_results=20,
+        )
+        # q0 alone yields 10, so only q1 is needed (and started) for the rest
+        assert len(results) == 20
+        assert pulled == ["q0", "q1"]
+
+    def test_lookahead_widens_when_queries_yield_little(self):
+        second_started = threading.Event()
+        overlapped: list[bool] = []
+
+        def search(query: str) -> list[dict]:
+            if query == "q1":
+                # q2 only starts meanwhile if the lookahead allows it
+                overlapped.append(second_started.wait(timeout=5))
+            elif query == "q2":
+                second_started.set()
+            return _make_items(1, url_prefix=f"https://example.com/{query}/")
+
+        results = collect_results(
+            search,
+            (f"q{i}" for i in range(4)),
+            workers=4,
+            url_key="link",
+            title_key="title",
+            snippet_key="snippet",
+            max_results=50,
+        )
+        assert len(results) == 4
+        assert overlapped == [True]
+
+
+# ---------------------------------------------------------------------------
+# prefetch — bounded concurrent lookahead
+# ---------------------------------------------------------------------------
+
+
+class TestPrefetch:
+    def test_results_in_argument_order(self):
+        assert list(prefetch(lambda x: x * 2, range(10), workers=4)) == [
+            x * 2 for x in range(10)
+        ]
+
+    def test_early_stop_bounds_extra_calls(self):
+        called: list[int] = []
+
+        def fn(x: int) -> int:
+            called.append(x)
+            return x
+
+        for x in prefetch(fn, range(100), workers=3):
+            if x == 1:
+                break
+        # Results 0 and 1 consumed; at most workers - 1 more were started
+        assert len(called) <= 4
+
+    def test_ahead_gates_calls_beyond_the_first_in_flight(self):
+        called: list[int] = []
+
+        def fn(x: int) -> int:
+            called.append(x)
+            return x
+
+        for x in prefetch(fn, range(100), workers=3, ahead=lambda _: False):
+            if x == 1:
+                break
+        assert called == [0, 1]
+
+
+# ---------------------------------------------------------------------------
+# fetch_pages — concurrent pagination
+# ---------------------------------------------------------------------------
+
+
+def _paged_search(total: int, page_size: int = 10):
+    """Return a search(offset) fake over *total* items, recording offsets."""
+    requested: list[int] = []
+
+    def search(offset: int) -> list[dict]:
+        requested.append(offset)
+        return [{"n": n} for n in range(offset, min(offset + page_size, total))]
+
+    return search, requested
+
+
+class TestFetchPages:
+    def test_items_returned_in_offset_order(self):
+        search, _ = _paged_search(total=100)
+        items = fetch_pages(search, range(0, 100, 10), page_size=10, max_results=55)
+        assert [i["n"] for i in items] == list(range(55))
+
+    def test_requests_only_pages_needed_for_max_results(self):
+        search, requested = _paged_search(total=100)
+        fetch_pages(search, range(0, 100, 10), page_size=10, max_results=25)
+        assert sorted(requested) == [0, 10, 20]
+
+    def test_stops_at_short_page(self):
+        search, requested = _paged_search(total=23)
+        items = fetch_pages(search, range(0, 100, 10), page_size=10, max_results=100)
+        assert len(items) == 23
+        assert max(requested) < 60  # at most one speculative wave past the end
+
+    def test_short_first_page_makes_single_request(self):
+        search, requested = _paged_search(total=4)
+        fetch_pages(search, range(0, 100, 10), page_size=10, max_results=100)
+        assert requested == [0]
+
+
 # ---------------------------------------------------------------------------
 # GoogleSearchSource.fetch — injected session
 # ---------------------------------------------------------------------------
 
 
 class TestGoogleSearchSourceFetch:
-    def test_returns_list_of_raw_results(self):
-        source = GoogleSearchSource(_config(), session=_mock_session(_make_items(3)))
+    def test_returns_list_of_raw_results(self, cse):
+        source = GoogleSearchSource(_config(), session=_serve(cse, _make_items(3)))
         results = source.fetch([], [], [])
-        assert isinstance(results, list)
+        assert len(results) > 0
         assert all(isinstance(r, RawSearchResult) for r in results)
 
-    def test_result_fields_populated(self):
-        source = GoogleSearchSource(_config(), session=_mock_session(_make_items(1)))
+    def test_result_fields_populated(self, cse):
+        source = GoogleSearchSource(_config(), session=_serve(cse, _make_items(3)))
         result = source.fetch([], [], [])[0]
         assert result.url == "https://example.com/job/1"
         assert result.title == "Job 1"
         assert result.snippet == "Snippet 1"
 
-    def test_capped_by_max_results(self):
-        source = GoogleSearchSource(
-            _config(max_results=3), session=_mock_session(_make_items(10))
-        )
+    def test_capped_by_max_results(self, cse):
+        session = _serve(cse, _make_items(10))
+        source = GoogleSearchSource(_config(max_results=3), session=session)
         results = source.fetch([], [], [])
         assert len(results) <= 3
 
-    def test_empty_api_response_returns_empty_list(self):
-        source = GoogleSearchSource(_config(), session=_mock_session_empty())
+    def test_empty_api_response_returns_empty_list(self, cse):
+        source = GoogleSearchSource(_config(), session=_serve(cse))
         assert source.fetch([], [], []) == []
 
-    def test_deduplicates_by_url_across_queries(self):
+    def test_deduplicates_by_url_across_queries(self, cse):
         # Two locations → two queries, but items share the same URLs
-        shared_items = _make_items(2)
         source = GoogleSearchSource(
             _config(max_results=20),
-            session=_mock_session(shared_items),
+            session=_serve(cse, _make_items(2)),
         )
         results = source.fetch(["New York", "Austin"], [], [])
         urls = [r.url for r in results]
         assert len(urls) == len(set(urls)), "Duplicate URLs found"
 
-    def test_http_error_returns_empty_gracefully(self):
-        from requests.exceptions import HTTPError
-
-        session = MagicMock()
-        response = MagicMock()
-        response.status_code = 403
-        response.raise_for_status.side_effect = HTTPError(response=response)
-        session.get.return_value = response
-
+    def test_http_error_returns_empty_gracefully(self, cse):
+        session = _serve(cse, _make_items(1), status=403)
         source = GoogleSearchSource(_config(), session=session)
         results = source.fetch([], [], [])
         assert results == []
 
-    def test_timeout_returns_empty_gracefully(self):
-        from requests.exceptions import Timeout
-
-        session = MagicMock()
-        session.get.side_effect = Timeout()
-        source = GoogleSearchSource(_config(), session=session)
+    def test_timeout_returns_empty_gracefully(self, cse):
+        source = GoogleSearchSource(_config(), session=_serve(cse, body=Timeout()))
         assert source.fetch([], [], []) == []
 
-    def test_one_query_per_location(self):
-        session = _mock_session(_make_items(1))
+    def test_one_query_per_location(self, cse):
+        session = _serve(cse, _make_items(1))
         source = GoogleSearchSource(_config(max_results=20), session=session)
         source.fetch(["New York", "Austin", "Boston"], [], [])
         # 3 locations → at least 3 GET calls (one per query, plus possible pagination)
-        assert session.get.call_count >= 3
+        assert len(cse.calls) >= 3
 
-    def test_no_results_when_items_missing_link(self):
+    def test_no_results_when_items_missing_link(self, cse):
         bad_items = [{"title": "No link", "snippet": "..."}]  # missing "link"
-        source = GoogleSearchSource(_config(), session=_mock_session(bad_items))
+        source = GoogleSearchSource(_config(), session=_serve(cse, bad_items))
         assert source.fetch([], [], []) == []
 
-    def test_ats_domains_produces_more_queries(self):
+    def test_ats_domains_produces_more_queries(self, cse):
         """When ats_domains is passed, more GET requests are made."""
-        session = _mock_session(_make_items(1))
+        session = _serve(cse, _make_items(1))
         source = GoogleSearchSource(_config(max_results=50), session=session)
         # Without ATS: 1 query → 1 GET
         source.fetch([], [], [])
-        calls_without = session.get.call_count
+        calls_without = len(cse.calls)
 
-        session.reset_mock()
+        cse.calls.reset()
         source.fetch([], [], [], ats_domains=_TINY_ATS)
-        calls_with = session.get.call_count
+        calls_with = len(cse.calls)
 
         assert calls_with > calls_without
 
-    def test_ats_domains_none_unchanged_behavior(self):
+    def test_ats_domains_none_unchanged_behavior(self, cse):
         """ats_domains=None should behave identically to no argument."""
-        session = _mock_session(_make_items(3))
-        source = GoogleSearchSource(_config(), session=session)
+        source = GoogleSearchSource(_config(), session=_serve(cse, _make_items(3)))
         r1 = source.fetch([], [], [])
-        session.reset_mock()
         r2 = source.fetch([], [], [], ats_domains=None)
         assert len(r1) == len(r2)
 
 
+# ---------------------------------------------------------------------------
+# api_session — shared session factory
+# ---------------------------------------------------------------------------
+
+
+class TestApiSession:
+    def test_headers_applied(self):
+        session = api_session(
+            {"Accept": "application/json"}, page_workers=1, query_workers=1
+        )
+        assert session.headers["Accept"] == "application/json"
+
+    def test_pool_sized_for_every_in_flight_request(self):
+        session = api_session({}, page_workers=4, query_workers=3)
+        assert session.get_adapter(_CSE_URL)._pool_maxsize == 12
+
+    def test_default_session_uses_source_workers(self):
+        session = GoogleSearchSource._default_session()
+        assert session.get_adapter(_CSE_URL)._pool_maxsize == (
+            _PAGE_WORKERS * _QUERY_WORKERS
+        )
+
+
 # ---------------------------------------------------------------------------
 # GoogleSearchConfig defaults
 # ---------------------------------------------------------------------------
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import itertools
+
+import pytest
+
 from internship_engine.location_filter import LocationFilter, apply_location_filter
 from internship_engine.models import JobPosting
 
@@ -19,6 +23,16 @@ def _posting(location: str, suffix: str = "1") -> JobPosting:
     )
 
 
+_BULK_LOCATIONS = ("New York, NY", "Austin, TX", "Remote", "Chicago, IL")
+
+
+@pytest.fixture(scope="module")
+def postings_10k() -> list[JobPosting]:
+    """10,000 postings cycling through _BULK_LOCATIONS, built once per module."""
+    cycled = itertools.islice(itertools.cycle(_BULK_LOCATIONS), 10_000)
+    return [_posting(loc, str(i)) for i, loc in enumerate(cycled)]
+
+
 # ---------------------------------------------------------------------------
 # LocationFilter.matches — default (no restrictions)
 # ---------------------------------------------------------------------------
@@ -71,37 +85,46 @@ class TestLocationFilterRemoteFlag:
 
 
 class TestLocationFilterAllowedLocations:
-    def test_single_location_match(self):
-        f = LocationFilter(allowed_locations=("New York",))
-        assert f.matches(_posting("New York, NY")) is True
-
-    def test_single_location_no_match(self):
-        f = LocationFilter(allowed_locations=("New York",))
-        assert f.matches(_posting("Chicago, IL")) is False
-
-    def test_case_insensitive_match(self):
-        f = LocationFilter(allowed_locations=("new york",))
-        assert f.matches(_posting("New York, NY")) is True
-
-    def test_case_insensitive_filter_vs_uppercase_location(self):
-        f = LocationFilter(allowed_locations=("NEW YORK",))
-        assert f.matches(_posting("new york, ny")) is True
-
-    def test_multiple_allowed_locations_first_matches(self):
-        f = LocationFilter(allowed_locations=("New York", "San Francisco"))
-        assert f.matches(_posting("New York, NY")) is True
+    @pytest.mark.parametrize(
+        ("allowed", "location", "expected"),
+        [
+            (("New York",), "New York, NY", True),
+            (("New York",), "Chicago, IL", False),
+            (("new york",), "New York, NY", True),
+            (("NEW YORK",), "new york, ny", True),
+            (("New York", "San Francisco"), "New York, NY", True),
+            (("New York", "San Francisco"), "San Francisco, CA", True),
+            (("New York", "San Francisco"), "Chicago, IL", False),
+            (("York",), "New York, NY", True),
+        ],
+        ids=[
+            "single-match",
+            "single-no-match",
+            "case-insensitive-filter",
+            "case-insensitive-location",
+            "multiple-first-matches",
+            "multiple-second-matches",
+            "multiple-none-match",
+            "substring-of-longer-string",
+        ],
+    )
+    def test_matches(self, allowed, location, expected):
+        f = LocationFilter(allowed_locations=allowed)
+        assert f.matches(_posting(location)) is expected
 
-    def test_multiple_allowed_locations_second_matches(self):
-        f = LocationFilter(allowed_locations=("New York", "San Francisco"))
-        assert f.matches(_posting("San Francisco, CA")) is True
+    def test_mixed_case_patterns_match_any_case(self):
+        f = LocationFilter(allowed_locations=("New York", "AUSTIN"))
+        assert f.matches(_posting("new york, NY")) is True
+        assert f.matches(_posting("Austin, TX")) is True
+        assert f.matches(_posting("Boston, MA")) is False
 
-    def test_multiple_allowed_locations_none_match(self):
-        f = LocationFilter(allowed_locations=("New York", "San Francisco"))
-        assert f.matches(_posting("Chicago, IL")) is False
+    def test_regex_metacharacters_matched_literally(self):
+        f = LocationFilter(allowed_locations=("Washington, D.C.",))
+        assert f.matches(_posting("Washington, D.C., USA")) is True
+        assert f.matches(_posting("Washington, DXCX")) is False
 
-    def test_substring_match_within_longer_string(self):
-        f = LocationFilter(allowed_locations=("York",))
-        assert f.matches(_posting("New York, NY")) is True
+    def test_equality_ignores_cached_patterns(self):
+        assert LocationFilter(("Austin",)) == LocationFilter(("Austin",))
 
     def test_remote_bypasses_allowed_locations(self):
         # Remote posting passes regardless of allowed_locations when include_remote=True
@@ -151,3 +174,30 @@ class TestApplyLocationFilter:
         ]
         result = apply_location_filter(postings, f)
         assert result == postings  # all pass and order is maintained
+
+    def test_agrees_with_matches(self):
+        postings = [
+            _posting(loc, str(i))
+            for i, loc in enumerate(("New York, NY", "Chicago, IL", "Remote", "Austin"))
+        ]
+        for allowed in ((), ("new york",), ("Austin", "Chicago")):
+            for include_remote in (True, False):
+                f = LocationFilter(allowed, include_remote=include_remote)
+                expected = [p for p in postings if f.matches(p)]
+                assert apply_location_filter(postings, f) == expected
+
+    @pytest.mark.parametrize(
+        ("allowed", "include_remote", "expected"),
+        [
+            ((), True, 10_000),
+            ((), False, 7_500),
+            (("New York",), True, 5_000),
+            (("new york", "Chicago"), False, 5_000),
+            (("London",), False, 0),
+        ],
+    )
+    def test_bulk_counts(self, postings_10k, allowed, include_remote, expected):
+        f = LocationFilter(allowed, include_remote=include_remote)
+        result = apply_location_filter(postings_10k, f)
+        assert len(result) == expected
+        assert result == [p for p in postings_10k if f.matches(p)]
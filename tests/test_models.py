@@ -0,0 +1,101 @@
+"""Unit tests for internship_engine.models."""
+
+from __future__ import annotations
+
+from internship_engine.models import Category, JobPosting
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _posting(title: str = "Software Intern", description: str = "") -> JobPosting:
+    return JobPosting(
+        title=title,
+        company="Acme Corp",
+        location="New York, NY",
+        description=description,
+        posting_url="https://example.com/job/1",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Derived search text
+# ---------------------------------------------------------------------------
+
+
+class TestSearchText:
+    def test_lowercased_title_and_description(self):
+        p = _posting("Data Intern", "Work With SQL")
+        assert p.search_text == "data intern work with sql"
+
+    def test_not_serialised(self):
+        p = _posting()
+        _ = p.search_text
+        assert "search_text" not in p.model_dump()
+
+    def test_copy_keeps_cache_for_unrelated_update(self):
+        p = _posting("Data Intern")
+        _ = p.search_text
+        copied = p.model_copy(update={"category": Category.DATA})
+        assert copied.__dict__.get("search_text") == "data intern "
+
+    def test_copy_recomputes_after_title_update(self):
+        p = _posting("Data Intern")
+        _ = p.search_text
+        copied = p.model_copy(update={"title": "Design Intern"})
+        assert copied.search_text == "design intern "
+
+
+class TestTitleAndDescriptionLower:
+    def test_lowercased_fields(self):
+        p = _posting("Data Intern", "Work With SQL")
+        assert (p.title_lower, p.description_lower) == ("data intern", "work with sql")
+
+    def test_copy_recomputes_only_updated_field(self):
+        p = _posting("Data Intern", "Work With SQL")
+        _ = p.title_lower, p.description_lower
+        copied = p.model_copy(update={"title": "Design Intern"})
+        assert copied.__dict__.get("description_lower") == "work with sql"
+        assert copied.title_lower == "design intern"
+
+
+class TestLocationLower:
+    def test_lowercased_location(self):
+        assert _posting().location_lower == "new york, ny"
+
+    def test_copy_recomputes_after_location_update(self):
+        p = _posting()
+        _ = p.location_lower
+        copied = p.model_copy(update={"location": "Austin, TX"})
+        assert copied.location_lower == "austin, tx"
+
+
+class TestDedupKey:
+    def test_joins_lowercased_identity_fields(self):
+        p = _posting("Data Intern")
+        assert p.dedup_key == "data intern\x00acme corp\x00https://example.com/job/1"
+
+    def test_copy_keeps_cache_for_unrelated_update(self):
+        p = _posting()
+        key = p.dedup_key
+        copied = p.model_copy(update={"description": "New text"})
+        assert copied.__dict__.get("dedup_key") == key
+
+    def test_copy_recomputes_after_url_update(self):
+        p = _posting()
+        _ = p.dedup_key
+        copied = p.model_copy(update={"posting_url": "https://example.com/job/2"})
+        assert copied.dedup_key.endswith("https://example.com/job/2")
+
+
+class TestDedupHash:
+    def test_computed_once_per_instance(self):
+        p = _posting()
+        assert p.dedup_hash is p.dedup_hash
+
+    def test_copy_recomputes_after_company_update(self):
+        p = _posting()
+        before = p.dedup_hash
+        copied = p.model_copy(update={"company": "Globex"})
+        assert copied.dedup_hash != before
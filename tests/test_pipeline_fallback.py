@@ -8,12 +8,19 @@ _make_posting() and the location-filter bypass in cmd_run().
 from __future__ import annotations
 
 import argparse
+import copy
+import os
+from contextlib import ExitStack
 from datetime import date
 from unittest.mock import MagicMock, patch
 
-from internship_engine.cli import _make_posting
+import pytest
+
+from internship_engine.active_check import ActiveCheckResult
+from internship_engine.cli import _make_posting, cmd_run
+from internship_engine.config import reset_settings
 from internship_engine.extractor import ExtractionResult
-from internship_engine.models import DatePostedConfidence, JobPosting
+from internship_engine.models import ActiveStatus, DatePostedConfidence, JobPosting
 from internship_engine.sources.google_search import RawSearchResult
 
 # ---------------------------------------------------------------------------
@@ -55,40 +62,33 @@ def _ext_blocked() -> ExtractionResult:
 
 
 class TestMakePostingSuccessful:
-    def test_title_from_extraction(self):
-        p = _make_posting(_raw(), _ext_ok(), "brave")
-        assert p.title == "Extracted Title"
+    def test_fields_from_extraction(self):
+        """Extracted fields win; URL and source come from the search side."""
+        p = _make_posting(_raw(url="https://indeed.com/job/123"), _ext_ok(), "google")
+        assert (
+            p.title,
+            p.company,
+            p.location,
+            p.description,
+            p.date_posted,
+            p.date_posted_confidence,
+            p.source,
+            p.posting_url,
+        ) == (
+            "Extracted Title",
+            "Extracted Co",
+            "New York, NY",
+            "Extracted description.",
+            date(2024, 6, 1),
+            DatePostedConfidence.EXACT,
+            "google",
+            "https://indeed.com/job/123",
+        )
 
     def test_title_falls_back_to_search_result(self):
         p = _make_posting(_raw(title="Search Title"), _ext_ok(title=""), "brave")
         assert p.title == "Search Title"
 
-    def test_company_from_extraction(self):
-        p = _make_posting(_raw(), _ext_ok(), "brave")
-        assert p.company == "Extracted Co"
-
-    def test_location_from_extraction(self):
-        p = _make_posting(_raw(), _ext_ok(), "brave")
-        assert p.location == "New York, NY"
-
-    def test_description_from_extraction(self):
-        p = _make_posting(_raw(), _ext_ok(), "brave")
-        assert p.description == "Extracted description."
-
-    def test_date_posted_from_extraction(self):
-        p = _make_posting(_raw(), _ext_ok(), "brave")
-        assert p.date_posted == date(2024, 6, 1)
-        assert p.date_posted_confidence == DatePostedConfidence.EXACT
-
-    def test_source_name_stored(self):
-        p = _make_posting(_raw(), _ext_ok(), "google")
-        assert p.source == "google"
-
-    def test_posting_url_always_from_search_result(self):
-        raw = _raw(url="https://indeed.com/job/123")
-        p = _make_posting(raw, _ext_ok(), "brave")
-        assert p.posting_url == "https://indeed.com/job/123"
-
 
 # ---------------------------------------------------------------------------
 # _make_posting: blocked extraction
@@ -96,40 +96,32 @@ class TestMakePostingSuccessful:
 
 
 class TestMakePostingBlocked:
-    def test_title_falls_back_to_search_result(self):
-        raw = _raw(title="Indeed: Software Intern")
-        p = _make_posting(raw, _ext_blocked(), "brave")
-        assert p.title == "Indeed: Software Intern"
-
-    def test_company_is_unknown_when_blocked(self):
-        p = _make_posting(_raw(), _ext_blocked(), "brave")
-        assert p.company == "Unknown"
-
-    def test_location_is_unknown_when_blocked(self):
-        p = _make_posting(_raw(), _ext_blocked(), "brave")
-        assert p.location == "Unknown"
-
-    def test_description_uses_snippet_when_blocked(self):
-        raw = _raw(snippet="Python intern at Acme, New York.")
-        p = _make_posting(raw, _ext_blocked(), "brave")
-        assert p.description == "Python intern at Acme, New York."
-
-    def test_date_posted_is_none_when_blocked(self):
-        p = _make_posting(_raw(), _ext_blocked(), "brave")
-        assert p.date_posted is None
-
-    def test_date_confidence_is_unknown_when_blocked(self):
-        p = _make_posting(_raw(), _ext_blocked(), "brave")
-        assert p.date_posted_confidence == DatePostedConfidence.UNKNOWN
-
-    def test_posting_url_from_search_result_when_blocked(self):
-        raw = _raw(url="https://linkedin.com/jobs/view/999")
+    def test_falls_back_to_search_result(self):
+        """Title and snippet stand in; company/location/date become unknown."""
+        raw = _raw(
+            url="https://linkedin.com/jobs/view/999",
+            title="Indeed: Software Intern",
+            snippet="Python intern at Acme, New York.",
+        )
         p = _make_posting(raw, _ext_blocked(), "brave")
-        assert p.posting_url == "https://linkedin.com/jobs/view/999"
-
-    def test_returns_job_posting_instance(self):
-        p = _make_posting(_raw(), _ext_blocked(), "brave")
         assert isinstance(p, JobPosting)
+        assert (
+            p.title,
+            p.company,
+            p.location,
+            p.description,
+            p.date_posted,
+            p.date_posted_confidence,
+            p.posting_url,
+        ) == (
+            "Indeed: Software Intern",
+            "Unknown",
+            "Unknown",
+            "Python intern at Acme, New York.",
+            None,
+            DatePostedConfidence.UNKNOWN,
+            "https://linkedin.com/jobs/view/999",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -208,84 +200,158 @@ class TestMakePostingEmptyExtraction:
 # ---------------------------------------------------------------------------
 
 
-class TestLocationFilterBypass:
-    """cmd_run must not drop blocked postings even when location filters are set."""
-
-    def _run_cmd(self, locations: list[str], raw_results, ext_result) -> list:
-        """Run cmd_run with mocked source and extractor; return captured postings."""
-        captured: list[JobPosting] = []
-
-        args = argparse.Namespace(
-            source="brave",
-            locations=locations,
-            no_remote=False,
-            keywords=[],
-            categories=[],
-            max_results=10,
-            posted_within_days=None,
-            export="none",
-            sheet_id=None,
-            sheet_tab=None,
-            track="all",
-            only_active=False,
-            active_check_max=10,
-            drop_unknown_active=False,
-            no_ats=True,
+_BASE_ARGS = argparse.Namespace(
+    source="brave",
+    locations=[],
+    no_remote=False,
+    keywords=[],
+    categories=[],
+    max_results=10,
+    posted_within_days=None,
+    export="none",
+    sheet_id=None,
+    sheet_tab=None,
+    track="all",
+    only_active=False,
+    active_check_max=10,
+    drop_unknown_active=False,
+    no_ats=True,
+)
+
+
+def _run_args(locations: list[str]) -> argparse.Namespace:
+    """Shallow copy of _BASE_ARGS with *locations* swapped in."""
+    args = copy.copy(_BASE_ARGS)
+    args.locations = locations
+    return args
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    """Give every cmd_run a freshly loaded settings singleton."""
+    reset_settings()
+    yield
+    reset_settings()
+
+
+@pytest.fixture(scope="class")
+def run_cmd(tmp_path_factory):
+    """Patch the source, extractor, dedup filter and summary once per class.
+
+    The run's state files are redirected into a temporary directory.
+
+    Yields ``run(locations, raw_results, ext_result, **overrides)``, which
+    runs :func:`cmd_run` against those doubles (with *overrides* applied to
+    the args) and returns the postings that would have been printed.
+    """
+    mock_source = MagicMock()
+    mock_extractor = MagicMock()
+    captured: list[JobPosting] = []
+
+    state_dir = tmp_path_factory.mktemp("state")
+    with ExitStack() as stack:
+        # Keep cmd_run's seen-hash and query-stats files out of the repo
+        stack.enter_context(
+            patch.dict(
+                os.environ,
+                {
+                    "IE_SEEN_HASHES_PATH": str(state_dir / "seen_hashes.txt"),
+                    "IE_QUERY_STATS_PATH": str(state_dir / "query_stats.json"),
+                },
+            )
+        )
+        stack.enter_context(
+            patch(
+                "internship_engine.cli._build_source",
+                return_value=(mock_source, "brave"),
+            )
+        )
+        stack.enter_context(
+            patch("internship_engine.extractor.Extractor", return_value=mock_extractor)
+        )
+        mock_dup = stack.enter_context(
+            patch("internship_engine.deduplication.DuplicateFilter")
+        )
+        mock_dup.return_value.is_new.return_value = True
+        stack.enter_context(
+            patch("internship_engine.cli._print_summary", side_effect=captured.extend)
         )
 
-        mock_source = MagicMock()
-        mock_source.fetch.return_value = raw_results
+        def run(
+            locations: list[str], raw_results, ext_result, **overrides
+        ) -> list[JobPosting]:
+            captured.clear()
+            mock_source.fetch.return_value = raw_results
+            mock_extractor.fetch_and_extract.return_value = ext_result
+            args = _run_args(locations)
+            vars(args).update(overrides)
+            cmd_run(args)
+            return list(captured)
 
-        mock_extractor = MagicMock()
-        mock_extractor.fetch_and_extract.return_value = ext_result
+        yield run
 
-        def capture_summary(postings):
-            captured.extend(postings)
 
-        with (
-            patch(
-                "internship_engine.cli._build_source",
-                return_value=(mock_source, "brave"),
+class TestLocationFilterBypass:
+    """cmd_run must not drop blocked postings even when location filters are set."""
+
+    @pytest.mark.parametrize(
+        ("locations", "url", "ext", "expected_companies"),
+        [
+            # Blocked postings are kept even when a location filter is active
+            (
+                ["San Francisco"],
+                "https://indeed.com/job/1",
+                _ext_blocked(),
+                ["Unknown"],
             ),
-            patch(
-                "internship_engine.extractor.Extractor",
-                return_value=mock_extractor,
+            # Non-blocked postings with mismatched location are still dropped
+            (
+                ["San Francisco"],
+                "https://company.com/job/1",
+                _ext_ok(location="Austin, TX"),
+                [],
             ),
-            patch("internship_engine.deduplication.DuplicateFilter") as mock_dup,
-            patch("internship_engine.cli._print_summary", side_effect=capture_summary),
-        ):
-            mock_dup.return_value.is_new.return_value = True
-            from internship_engine.cli import cmd_run
-            from internship_engine.config import reset_settings
-
-            reset_settings()
-            cmd_run(args)
-
-        return captured
-
-    def test_blocked_posting_survives_location_filter(self):
-        """Blocked postings are kept even when a location filter is active."""
-        raw = _raw(url="https://indeed.com/job/1", title="SW Intern", snippet="snippet")
-        postings = self._run_cmd(["San Francisco"], [raw], _ext_blocked())
-        assert len(postings) == 1
-        assert postings[0].company == "Unknown"
-
-    def test_non_blocked_posting_dropped_by_location_filter(self):
-        """Non-blocked postings with mismatched location are still dropped."""
-        raw = _raw(url="https://company.com/job/1")
-        ext = _ext_ok(location="Austin, TX")
-        postings = self._run_cmd(["San Francisco"], [raw], ext)
-        assert len(postings) == 0
-
-    def test_non_blocked_matching_location_passes_filter(self):
-        """Non-blocked postings with matching location still pass."""
-        raw = _raw(url="https://company.com/job/1")
-        ext = _ext_ok(location="San Francisco, CA")
-        postings = self._run_cmd(["San Francisco"], [raw], ext)
-        assert len(postings) == 1
-
-    def test_blocked_posting_no_location_filter_also_passes(self):
-        """Blocked postings with no location restrictions always pass."""
-        raw = _raw(url="https://indeed.com/job/2")
-        postings = self._run_cmd([], [raw], _ext_blocked())
-        assert len(postings) == 1
+            # Non-blocked postings with matching location still pass
+            (
+                ["San Francisco"],
+                "https://company.com/job/1",
+                _ext_ok(location="San Francisco, CA"),
+                ["Extracted Co"],
+            ),
+            # Blocked postings with no location restrictions always pass
+            ([], "https://indeed.com/job/2", _ext_blocked(), ["Unknown"]),
+        ],
+        ids=[
+            "blocked-survives-filter",
+            "non-blocked-mismatch-dropped",
+            "non-blocked-match-passes",
+            "blocked-no-filter-passes",
+        ],
+    )
+    def test_location_filter_bypass(
+        self, run_cmd, locations, url, ext, expected_companies
+    ):
+        postings = run_cmd(locations, [_raw(url=url)], ext)
+        assert [p.company for p in postings] == expected_companies
+
+
+class TestActiveCheckSharing:
+    """Postings that share a canonical URL get one network active-check."""
+
+    def test_one_check_per_canonical_url(self, run_cmd):
+        raws = [
+            _raw(url="https://indeed.com/job/1"),
+            _raw(url="https://indeed.com/job/1?utm_source=x"),
+            _raw(url="https://indeed.com/job/2"),
+        ]
+        verdict = ActiveCheckResult(ActiveStatus.ACTIVE, "checked")
+        with patch(
+            "internship_engine.active_check.check_active", return_value=verdict
+        ) as mock_check:
+            postings = run_cmd([], raws, _ext_blocked(), only_active=True)
+
+        assert sorted(c.args[0] for c in mock_check.call_args_list) == [
+            "https://indeed.com/job/1",
+            "https://indeed.com/job/2",
+        ]
+        assert [p.active_reason for p in postings] == ["checked"] * 3
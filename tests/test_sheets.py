@@ -7,8 +7,10 @@ with lightweight fakes so no real API calls are made.
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass, field, replace
 from datetime import date
-from unittest.mock import MagicMock, call, patch
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -17,6 +19,7 @@ from internship_engine.models import Category, DatePostedConfidence, JobPosting
 from internship_engine.sheets import (
     _HASH_COL_INDEX,
     COLUMNS,
+    _col_letter,
     _posting_to_row,
     ensure_header,
     export_postings,
@@ -53,11 +56,48 @@ def _make_posting(
     )
 
 
-def _fake_worksheet(rows: list[list[str]] | None = None) -> MagicMock:
-    """Return a mock worksheet that reports *rows* from get_all_values()."""
-    ws = MagicMock()
-    ws.get_all_values.return_value = rows if rows is not None else []
-    return ws
+@dataclass
+class _FakeWorksheet:
+    """Worksheet double that serves *rows* and records the calls made on it.
+
+    Only the methods the sheets module uses are defined, so any other
+    worksheet call fails loudly with ``AttributeError``.
+    """
+
+    rows: list[list[str]] = field(default_factory=list)
+    get_all_values_calls: int = 0
+    row_values_calls: list[int] = field(default_factory=list)
+    col_values_calls: list[int] = field(default_factory=list)
+    insert_row_calls: list[tuple[list[str], int]] = field(default_factory=list)
+    update_calls: list[tuple[tuple, dict]] = field(default_factory=list)
+    append_rows_calls: list[tuple[list, dict]] = field(default_factory=list)
+
+    def get_all_values(self) -> list[list[str]]:
+        self.get_all_values_calls += 1
+        return self.rows
+
+    def row_values(self, n: int) -> list[str]:
+        """Return the 1-based row *n* of :attr:`rows`, or ``[]`` past the end."""
+        self.row_values_calls.append(n)
+        return self.rows[n - 1] if len(self.rows) >= n else []
+
+    def col_values(self, n: int) -> list[str]:
+        """Return the 1-based column *n* of :attr:`rows`."""
+        self.col_values_calls.append(n)
+        return [row[n - 1] if len(row) >= n else "" for row in self.rows]
+
+    def insert_row(self, values: list[str], index: int) -> None:
+        self.insert_row_calls.append((values, index))
+
+    def update(self, *args, **kwargs) -> None:
+        self.update_calls.append((args, kwargs))
+
+    def append_rows(self, values: list, **kwargs) -> None:
+        self.append_rows_calls.append((values, kwargs))
+
+
+def _fake_worksheet(rows: list[list[str]] | None = None) -> _FakeWorksheet:
+    return _FakeWorksheet(rows if rows is not None else [])
 
 
 # ---------------------------------------------------------------------------
@@ -69,18 +109,39 @@ class TestEnsureHeader:
     def test_inserts_header_when_sheet_is_empty(self):
         ws = _fake_worksheet([])
         ensure_header(ws)
-        ws.insert_row.assert_called_once_with(COLUMNS, 1)
+        assert ws.insert_row_calls == [(list(COLUMNS), 1)]
+
+    def test_raises_when_header_row_empty_above_data(self):
+        data_row = ["2024-06-01", "software", "Intern"] + [""] * 7 + ["abc"]
+        ws = _fake_worksheet([[""] * len(COLUMNS), data_row])
+        with pytest.raises(ValueError, match="header row is empty"):
+            ensure_header(ws)
+        assert ws.insert_row_calls == []
 
     def test_no_op_when_header_already_correct(self):
         ws = _fake_worksheet([COLUMNS])
         ensure_header(ws)
-        ws.insert_row.assert_not_called()
+        assert ws.insert_row_calls == []
+
+    def test_list_header_from_api_matches(self):
+        """gspread returns rows as lists; they must compare equal to COLUMNS."""
+        ws = _fake_worksheet([list(COLUMNS)])
+        ensure_header(ws)
+        assert ws.insert_row_calls == []
+        assert ws.update_calls == []
 
     def test_no_op_when_sheet_has_header_and_data(self):
         data_row = ["2024-06-01", "software", "Intern"] + [""] * 7 + ["abc"]
         ws = _fake_worksheet([COLUMNS, data_row])
         ensure_header(ws)
-        ws.insert_row.assert_not_called()
+        assert ws.insert_row_calls == []
+
+    def test_reads_only_header_row(self):
+        data_row = ["2024-06-01", "software", "Intern"] + [""] * 7 + ["abc"]
+        ws = _fake_worksheet([COLUMNS, data_row])
+        ensure_header(ws)
+        assert ws.row_values_calls == [1]
+        assert ws.get_all_values_calls == 0
 
     def test_raises_on_mismatched_header(self):
         ws = _fake_worksheet([["Wrong", "Header", "Row"]])
@@ -94,28 +155,42 @@ class TestEnsureHeader:
         old_header = COLUMNS[:11]
         ws = _fake_worksheet([old_header])
         ensure_header(ws)  # must not raise
-        ws.insert_row.assert_not_called()
-        assert ws.update_cell.call_count == len(COLUMNS) - 11
+        assert ws.insert_row_calls == []
+        assert len(ws.update_calls) == 1
 
     def test_auto_migration_appends_correct_column_names(self):
         old_header = COLUMNS[:11]
         ws = _fake_worksheet([old_header])
         ensure_header(ws)
-        ws.update_cell.assert_has_calls(
-            [
-                call(1, 12, "Status"),
-                call(1, 13, "Status Reason"),
-                call(1, 14, "Track Match"),
-            ]
-        )
+        assert ws.update_calls == [
+            (
+                ([["Status", "Status Reason", "Track Match"]], "L1:N1"),
+                {"value_input_option": "USER_ENTERED"},
+            )
+        ]
 
     def test_partial_migration_appends_only_missing(self):
         """Sheet with 13 cols only gets the 14th column appended."""
         header_13 = COLUMNS[:13]
         ws = _fake_worksheet([header_13])
         ensure_header(ws)
-        assert ws.update_cell.call_count == 1
-        ws.update_cell.assert_called_once_with(1, 14, "Track Match")
+        assert ws.update_calls == [
+            (([["Track Match"]], "N1:N1"), {"value_input_option": "USER_ENTERED"})
+        ]
+
+
+# ---------------------------------------------------------------------------
+# _col_letter
+# ---------------------------------------------------------------------------
+
+
+class TestColLetter:
+    @pytest.mark.parametrize(
+        ("index", "letters"),
+        [(1, "A"), (14, "N"), (26, "Z"), (27, "AA"), (52, "AZ"), (703, "AAA")],
+    )
+    def test_index_to_letters(self, index, letters):
+        assert _col_letter(index) == letters
 
 
 # ---------------------------------------------------------------------------
@@ -129,76 +204,60 @@ class TestPostingToRow:
         row = _posting_to_row(p, "abc123", "2024-06-01")
         assert len(row) == len(COLUMNS)
 
-    def test_added_at_in_first_column(self):
-        p = _make_posting()
-        row = _posting_to_row(p, "abc123", "2024-06-01")
-        assert row[COLUMNS.index("Added At")] == "2024-06-01"
-
     def test_hash_in_last_column(self):
         p = _make_posting()
         h = compute_hash(p)
         row = _posting_to_row(p, h, "2024-06-01")
         assert row[_HASH_COL_INDEX] == h
 
-    def test_category_value_string(self):
-        p = _make_posting(category=Category.DATA)
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Category")] == "data"
-
-    def test_category_empty_when_none(self):
-        p = _make_posting(category=None)
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Category")] == ""
-
-    def test_date_posted_as_iso_string(self):
-        p = _make_posting(date_posted=date(2024, 5, 15))
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Date Posted")] == "2024-05-15"
-
-    def test_date_posted_empty_when_none(self):
-        p = _make_posting(date_posted=None)
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Date Posted")] == ""
-
-    def test_date_confidence_value(self):
-        p = _make_posting(date_posted_confidence=DatePostedConfidence.UNKNOWN)
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Date Confidence")] == "unknown"
-
-    def test_apply_url_present(self):
-        p = _make_posting(apply_url="https://apply.example.com")
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Apply URL")] == "https://apply.example.com"
-
-    def test_apply_url_empty_when_none(self):
-        p = _make_posting(apply_url=None)
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Apply URL")] == ""
-
-    def test_posting_url(self):
-        p = _make_posting(posting_url="https://example.com/job/42")
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Posting URL")] == "https://example.com/job/42"
-
-    def test_source(self):
-        p = _make_posting(source="google")
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Source")] == "google"
-
-    def test_status_default_unknown(self):
-        p = _make_posting()
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Status")] == "unknown"
-
-    def test_active_reason_empty_by_default(self):
-        p = _make_posting()
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Status Reason")] == ""
-
-    def test_track_match_empty_by_default(self):
-        p = _make_posting()
-        row = _posting_to_row(p, "h", "2024-01-01")
-        assert row[COLUMNS.index("Track Match")] == ""
+    @pytest.mark.parametrize(
+        ("posting_kwargs", "column", "expected"),
+        [
+            ({}, "Added At", "2024-01-01"),
+            ({"category": Category.DATA}, "Category", "data"),
+            ({"category": None}, "Category", ""),
+            ({"date_posted": date(2024, 5, 15)}, "Date Posted", "2024-05-15"),
+            ({"date_posted": None}, "Date Posted", ""),
+            (
+                {"date_posted_confidence": DatePostedConfidence.UNKNOWN},
+                "Date Confidence",
+                "unknown",
+            ),
+            (
+                {"apply_url": "https://apply.example.com"},
+                "Apply URL",
+                "https://apply.example.com",
+            ),
+            ({"apply_url": None}, "Apply URL", ""),
+            (
+                {"posting_url": "https://example.com/job/42"},
+                "Posting URL",
+                "https://example.com/job/42",
+            ),
+            ({"source": "google"}, "Source", "google"),
+            ({}, "Status", "unknown"),
+            ({}, "Status Reason", ""),
+            ({}, "Track Match", ""),
+        ],
+        ids=[
+            "added-at",
+            "category-value",
+            "category-none",
+            "date-posted-iso",
+            "date-posted-none",
+            "date-confidence",
+            "apply-url",
+            "apply-url-none",
+            "posting-url",
+            "source",
+            "status-default",
+            "status-reason-default",
+            "track-match-default",
+        ],
+    )
+    def test_field(self, posting_kwargs, column, expected):
+        row = _posting_to_row(_make_posting(**posting_kwargs), "h", "2024-01-01")
+        assert row[COLUMNS.index(column)] == expected
 
     def test_track_match_value_written(self):
         from internship_engine.models import ActiveStatus
@@ -222,40 +281,47 @@ class TestPostingToRow:
 # ---------------------------------------------------------------------------
 
 
+def _row_with_hash(h: str) -> list[str]:
+    """A data row that carries only an "Added At" date and hash *h*."""
+    return ["2024-01-01"] + [""] * (_HASH_COL_INDEX - 1) + [h]
+
+
+@pytest.fixture
+def posting_with_hash() -> tuple[JobPosting, str]:
+    p = _make_posting()
+    return p, compute_hash(p)
+
+
 class TestUpsertRows:
     def test_appends_new_posting(self):
         p = _make_posting()
         ws = _fake_worksheet([COLUMNS])  # header only, no data rows
         count = upsert_rows(ws, [p], added_at=date(2024, 6, 1))
         assert count == 1
-        ws.append_rows.assert_called_once()
+        assert len(ws.append_rows_calls) == 1
 
-    def test_appended_row_has_correct_hash(self):
-        p = _make_posting()
+    def test_appended_row_has_correct_hash(self, posting_with_hash):
+        p, h = posting_with_hash
         ws = _fake_worksheet([COLUMNS])
         upsert_rows(ws, [p], added_at=date(2024, 6, 1))
-        appended_rows = ws.append_rows.call_args[0][0]
-        assert appended_rows[0][_HASH_COL_INDEX] == compute_hash(p)
+        appended_rows = ws.append_rows_calls[-1][0]
+        assert appended_rows[0][_HASH_COL_INDEX] == h
 
-    def test_skips_duplicate_hash(self):
-        p = _make_posting()
-        h = compute_hash(p)
-        existing = [COLUMNS, ["2024-01-01"] + [""] * (_HASH_COL_INDEX - 1) + [h]]
-        ws = _fake_worksheet(existing)
+    def test_skips_duplicate_hash(self, posting_with_hash):
+        p, h = posting_with_hash
+        ws = _fake_worksheet([COLUMNS, _row_with_hash(h)])
         count = upsert_rows(ws, [p], added_at=date(2024, 6, 2))
         assert count == 0
-        ws.append_rows.assert_not_called()
+        assert ws.append_rows_calls == []
 
-    def test_appends_only_new_among_mixed_batch(self):
-        p1 = _make_posting(title="Old Intern", posting_url="https://ex.com/1")
+    def test_appends_only_new_among_mixed_batch(self, posting_with_hash):
+        p1, h1 = posting_with_hash
         p2 = _make_posting(title="New Intern", posting_url="https://ex.com/2")
-        h1 = compute_hash(p1)
-        existing = [COLUMNS, ["2024-01-01"] + [""] * (_HASH_COL_INDEX - 1) + [h1]]
-        ws = _fake_worksheet(existing)
+        ws = _fake_worksheet([COLUMNS, _row_with_hash(h1)])
         count = upsert_rows(ws, [p1, p2], added_at=date(2024, 6, 1))
         assert count == 1
-        ws.append_rows.assert_called_once()
-        appended_rows = ws.append_rows.call_args[0][0]
+        assert len(ws.append_rows_calls) == 1
+        appended_rows = ws.append_rows_calls[-1][0]
         assert len(appended_rows) == 1
         assert appended_rows[0][_HASH_COL_INDEX] == compute_hash(p2)
 
@@ -270,30 +336,37 @@ class TestUpsertRows:
         ws = _fake_worksheet([COLUMNS])
         count = upsert_rows(ws, [], added_at=date(2024, 6, 1))
         assert count == 0
-        ws.append_rows.assert_not_called()
+        assert ws.append_rows_calls == []
 
     def test_added_at_uses_today_when_not_supplied(self):
         p = _make_posting()
         ws = _fake_worksheet([COLUMNS])
         today = date.today().isoformat()
         upsert_rows(ws, [p])
-        appended_rows = ws.append_rows.call_args[0][0]
+        appended_rows = ws.append_rows_calls[-1][0]
         assert appended_rows[0][COLUMNS.index("Added At")] == today
 
     def test_append_rows_uses_user_entered_input(self):
         p = _make_posting()
         ws = _fake_worksheet([COLUMNS])
         upsert_rows(ws, [p], added_at=date(2024, 6, 1))
-        _, kwargs = ws.append_rows.call_args
+        _, kwargs = ws.append_rows_calls[-1]
         assert kwargs.get("value_input_option") == "USER_ENTERED"
 
+    def test_reads_only_hash_column(self):
+        p = _make_posting()
+        ws = _fake_worksheet([COLUMNS])
+        upsert_rows(ws, [p], added_at=date(2024, 6, 1))
+        assert ws.col_values_calls == [_HASH_COL_INDEX + 1]
+        assert ws.get_all_values_calls == 0
+
     def test_returns_count_for_multiple_new_postings(self):
         p1 = _make_posting(title="Intern A", posting_url="https://ex.com/1")
         p2 = _make_posting(title="Intern B", posting_url="https://ex.com/2")
         ws = _fake_worksheet([COLUMNS])
         count = upsert_rows(ws, [p1, p2], added_at=date(2024, 6, 1))
         assert count == 2
-        appended_rows = ws.append_rows.call_args[0][0]
+        appended_rows = ws.append_rows_calls[-1][0]
         assert len(appended_rows) == 2
 
 
@@ -310,90 +383,143 @@ _FAKE_PKEY = (
 _BCF = "internship_engine.sheets.build_client_from_env"
 
 
-class TestExportPostings:
-    _SA_JSON = json.dumps(
-        {
-            "type": "service_account",
-            "project_id": "test-project",
-            "private_key_id": "key-id",
-            "private_key": _FAKE_PKEY,
-            "client_email": "test@test-project.iam.gserviceaccount.com",
-            "client_id": "123456789",
-            "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-            "token_uri": "https://oauth2.googleapis.com/token",
-        }
-    )
+_SA_JSON = json.dumps(
+    {
+        "type": "service_account",
+        "project_id": "test-project",
+        "private_key_id": "key-id",
+        "private_key": _FAKE_PKEY,
+        "client_email": "test@test-project.iam.gserviceaccount.com",
+        "client_id": "123456789",
+        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+)
+
+
+@dataclass(frozen=True)
+class _FakeSettings:
+    """The subset of :class:`~internship_engine.config.Settings` export reads."""
+
+    sheet_id: str | None = "sheet123"
+    sheet_tab: str = "Postings"
+    google_service_account_json: str = _SA_JSON
+    sheet_trust_cache: bool = False
+    sheet_hash_cache_dir: Path | None = None
 
-    def _make_settings(self, sheet_id="sheet123", tab="Postings"):
-        from internship_engine.config import reset_settings
 
-        reset_settings()
-        settings = MagicMock()
-        settings.sheet_id = sheet_id
-        settings.sheet_tab = tab
-        settings.google_service_account_json = self._SA_JSON
-        return settings
+_SETTINGS = _FakeSettings()
 
-    def _mock_client(self, ws: MagicMock) -> MagicMock:
+
+@pytest.fixture
+def build_client():
+    """Patch build_client_from_env; tests set ``return_value`` to their client."""
+    with patch(_BCF) as mock_build:
+        yield mock_build
+
+
+class TestExportPostings:
+    def _mock_client(self, ws: _FakeWorksheet) -> MagicMock:
         client = MagicMock()
         spreadsheet = MagicMock()
         spreadsheet.worksheet.return_value = ws
         client.open_by_key.return_value = spreadsheet
         return client
 
-    def test_opens_correct_sheet_id(self):
+    def test_opens_correct_sheet_id(self, build_client):
         ws = _fake_worksheet([COLUMNS])
         client = self._mock_client(ws)
-        settings = self._make_settings(sheet_id="MY_SHEET_ID")
+        settings = replace(_SETTINGS, sheet_id="MY_SHEET_ID")
 
-        with patch(_BCF, return_value=client):
-            export_postings(settings, [], sheet_id="MY_SHEET_ID")
+        build_client.return_value = client
+        export_postings(settings, [], sheet_id="MY_SHEET_ID")
 
         client.open_by_key.assert_called_once_with("MY_SHEET_ID")
 
-    def test_opens_correct_tab(self):
+    def test_opens_correct_tab(self, build_client):
         ws = _fake_worksheet([COLUMNS])
         client = self._mock_client(ws)
-        settings = self._make_settings(tab="Internships")
+        settings = replace(_SETTINGS, sheet_tab="Internships")
 
-        with patch(_BCF, return_value=client):
-            export_postings(settings, [], tab_name="Internships")
+        build_client.return_value = client
+        export_postings(settings, [], tab_name="Internships")
 
         client.open_by_key.return_value.worksheet.assert_called_once_with("Internships")
 
     def test_raises_when_no_sheet_id(self):
-        settings = self._make_settings(sheet_id=None)
+        settings = replace(_SETTINGS, sheet_id=None)
         with pytest.raises(ValueError, match="No Google Sheet ID"):
             export_postings(settings, [])
 
-    def test_appends_new_postings(self):
+    def test_appends_new_postings(self, build_client):
         p = _make_posting()
         ws = _fake_worksheet([COLUMNS])
         client = self._mock_client(ws)
-        settings = self._make_settings()
+        settings = _SETTINGS
 
-        with patch(_BCF, return_value=client):
-            count = export_postings(settings, [p])
+        build_client.return_value = client
+        count = export_postings(settings, [p])
 
         assert count == 1
-        ws.append_rows.assert_called_once()
+        assert len(ws.append_rows_calls) == 1
 
-    def test_falls_back_to_settings_sheet_id(self):
+    def test_falls_back_to_settings_sheet_id(self, build_client):
         ws = _fake_worksheet([COLUMNS])
         client = self._mock_client(ws)
-        settings = self._make_settings(sheet_id="SETTINGS_SHEET")
+        settings = replace(_SETTINGS, sheet_id="SETTINGS_SHEET")
 
-        with patch(_BCF, return_value=client):
-            export_postings(settings, [])
+        build_client.return_value = client
+        export_postings(settings, [])
 
         client.open_by_key.assert_called_once_with("SETTINGS_SHEET")
 
-    def test_falls_back_to_settings_tab(self):
+    def test_falls_back_to_settings_tab(self, build_client):
         ws = _fake_worksheet([COLUMNS])
         client = self._mock_client(ws)
-        settings = self._make_settings(tab="MyTab")
+        settings = replace(_SETTINGS, sheet_tab="MyTab")
 
-        with patch(_BCF, return_value=client):
-            export_postings(settings, [])
+        build_client.return_value = client
+        export_postings(settings, [])
 
         client.open_by_key.return_value.worksheet.assert_called_once_with("MyTab")
+
+    # -- Local hash cache (IE_SHEET_TRUST_CACHE) ----------------------------
+
+    def test_cold_cache_reads_sheet_and_writes_cache(self, build_client, tmp_path):
+        p = _make_posting()
+        ws = _fake_worksheet([COLUMNS])
+        settings = replace(
+            _SETTINGS, sheet_trust_cache=True, sheet_hash_cache_dir=tmp_path
+        )
+
+        build_client.return_value = self._mock_client(ws)
+        export_postings(settings, [p])
+
+        assert len(ws.col_values_calls) == 1
+        (cache_file,) = tmp_path.iterdir()
+        assert compute_hash(p) in cache_file.read_text()
+
+    def test_warm_cache_skips_hash_column_read(self, build_client, tmp_path):
+        p = _make_posting()
+        settings = replace(
+            _SETTINGS, sheet_trust_cache=True, sheet_hash_cache_dir=tmp_path
+        )
+        build_client.return_value = self._mock_client(_fake_worksheet([COLUMNS]))
+        export_postings(settings, [p])
+
+        ws = _fake_worksheet([COLUMNS])
+        build_client.return_value = self._mock_client(ws)
+        count = export_postings(settings, [p])
+
+        assert count == 0
+        assert ws.col_values_calls == []
+        assert ws.append_rows_calls == []
+
+    def test_cache_disabled_writes_nothing(self, build_client, tmp_path):
+        ws = _fake_worksheet([COLUMNS])
+        settings = replace(_SETTINGS, sheet_hash_cache_dir=tmp_path)
+
+        build_client.return_value = self._mock_client(ws)
+        export_postings(settings, [_make_posting()])
+
+        assert list(tmp_path.iterdir()) == []
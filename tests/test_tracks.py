@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import re
+
+import pytest
+
 from internship_engine.models import JobPosting
 from internship_engine.tracks import (
+    _WORD_RE,
     Track,
+    _KeywordSet,
+    _prepare,
+    _score_prepared,
     best_tracks,
+    classify,
     filter_by_track,
     score_all_tracks,
     score_track,
@@ -164,6 +173,11 @@ class TestNegativeKeywords:
         for track in (Track.SWE, Track.CYBER, Track.IT, Track.DATA):
             assert score_track(p, track) >= 0
 
+    def test_penalty_skipped_when_nothing_matches(self):
+        text = _prepare(_posting(title="Sales Intern", description="retail store"))
+        assert _score_prepared(text, Track.SWE) == 0
+        assert "penalty" not in text.__dict__
+
 
 # ---------------------------------------------------------------------------
 # score_all_tracks
@@ -182,6 +196,15 @@ class TestScoreAllTracks:
         p = _posting(title="Software Intern")
         assert Track.ALL not in score_all_tracks(p)
 
+    def test_agrees_with_score_track(self):
+        p = _posting(
+            title="Security Engineer Intern",
+            description="python, sql and network tooling; no sales",
+        )
+        assert score_all_tracks(p) == {
+            t: score_track(p, t) for t in Track if t != Track.ALL
+        }
+
 
 # ---------------------------------------------------------------------------
 # best_tracks / track_match_label
@@ -226,49 +249,95 @@ class TestTrackMatchLabel:
         assert len(parts) >= 1
         assert all(pt in ("cyber", "it", "swe", "data") for pt in parts)
 
+    def test_label_matches_best_tracks_order(self):
+        p = _posting(
+            title="Data Engineer Intern",
+            description="software engineer and security engineer duties",
+        )
+        assert track_match_label(p) == "|".join(t.value for t in best_tracks(p))
+        assert track_match_label(p) == "cyber|swe|data"
+
+
+class TestClassify:
+    def test_agrees_with_best_tracks_and_label(self):
+        p = _posting(title="Security Analyst Intern", description="sql dashboards")
+        assert classify(p) == (tuple(best_tracks(p)), track_match_label(p))
+
+    def test_membership_matches_filter_by_track(self):
+        postings = [
+            _posting(title="Software Engineer Intern"),
+            _posting(title="Help Desk Intern"),
+            _posting(title="Cashier"),
+        ]
+        for track in (Track.SWE, Track.IT, Track.CYBER, Track.DATA):
+            assert [p for p in postings if track in classify(p)[0]] == (
+                filter_by_track(postings, track)
+            )
+
+    def test_syndicated_copies_classified_alike(self):
+        a = _posting(title="Data Analyst Intern", posting_url="https://a.com/1")
+        b = _posting(title="Data Analyst Intern", posting_url="https://b.com/1")
+        assert classify(a) == classify(b) == ((Track.DATA,), "data")
+
+    def test_cached_text_honours_each_min_score(self):
+        p = _posting(title="Data Analyst Intern")
+        assert classify(p) == ((Track.DATA,), "data")
+        assert classify(p, min_score=100) == ((), "")
+        assert best_tracks(p, min_score=score_track(p, Track.DATA)) == [Track.DATA]
+
 
 # ---------------------------------------------------------------------------
 # filter_by_track
 # ---------------------------------------------------------------------------
 
 
-class TestFilterByTrack:
-    def _swe_posting(self, n: int = 1) -> JobPosting:
-        return _posting(
+@pytest.fixture(scope="module")
+def posting_pool() -> tuple[list[JobPosting], list[JobPosting], list[JobPosting]]:
+    """(swe, unrelated, interleaved) lists of 100/100/200 postings, built once."""
+    swe = [
+        _posting(
             title="Software Engineer Intern",
-            posting_url=f"https://example.com/{n}",
+            posting_url=f"https://example.com/s{i}",
         )
-
-    def _unrelated_posting(self, n: int = 99) -> JobPosting:
-        return _posting(
+        for i in range(100)
+    ]
+    unrelated = [
+        _posting(
             title="Cashier Retail Intern",
             description="sales customer service",
-            posting_url=f"https://example.com/{n}",
+            posting_url=f"https://example.com/u{i}",
         )
+        for i in range(100)
+    ]
+    mixed = [p for pair in zip(swe, unrelated) for p in pair]
+    return swe, unrelated, mixed
 
-    def test_all_track_is_no_op(self):
-        postings = [self._swe_posting(), self._unrelated_posting()]
-        assert filter_by_track(postings, Track.ALL) == postings
 
-    def test_swe_filter_keeps_swe(self):
-        p = self._swe_posting()
-        result = filter_by_track([p], Track.SWE)
-        assert p in result
+class TestFilterByTrack:
+    def test_all_track_is_no_op(self, posting_pool):
+        _, _, mixed = posting_pool
+        assert filter_by_track(mixed, Track.ALL) == mixed
 
-    def test_swe_filter_drops_unrelated(self):
-        p = self._unrelated_posting()
-        result = filter_by_track([p], Track.SWE)
-        assert p not in result
+    def test_swe_filter_keeps_swe(self, posting_pool):
+        swe, _, _ = posting_pool
+        assert filter_by_track(swe, Track.SWE) == swe
+
+    def test_swe_filter_drops_unrelated(self, posting_pool):
+        _, unrelated, _ = posting_pool
+        assert filter_by_track(unrelated, Track.SWE) == []
 
     def test_empty_input_returns_empty(self):
         assert filter_by_track([], Track.SWE) == []
 
-    def test_mixed_batch(self):
-        swe = self._swe_posting(1)
-        unrelated = self._unrelated_posting(2)
-        result = filter_by_track([swe, unrelated], Track.SWE)
-        assert swe in result
-        assert unrelated not in result
+    def test_mixed_batch(self, posting_pool):
+        swe, _, mixed = posting_pool
+        assert filter_by_track(mixed, Track.SWE) == swe
+
+    def test_syndicated_copies_both_kept(self):
+        a = _posting(title="Data Analyst Intern", posting_url="https://a.com/1")
+        b = _posting(title="Data Analyst Intern", posting_url="https://b.com/1")
+        assert filter_by_track([a, b], Track.DATA) == [a, b]
+        assert score_track(a, Track.DATA) == score_track(b, Track.DATA) > 0
 
 
 # ---------------------------------------------------------------------------
@@ -355,3 +424,53 @@ class TestWordBoundaryFalsePositives:
         """Multi-word phrases like 'software engineer' still use substring match."""
         p = _posting(title="Software Engineer Intern")
         assert score_track(p, Track.SWE) >= 10
+
+    def test_punctuation_is_a_word_boundary(self):
+        """'java' matches in 'java-based', as the \\b regex did."""
+        p = _posting(title="Intern", description="java-based services")
+        assert score_track(p, Track.SWE) == 1
+
+    def test_digits_extend_a_word(self):
+        """'python' does not match inside 'python3'."""
+        p = _posting(title="Intern", description="python3 scripts")
+        assert score_track(p, Track.SWE) == 0
+
+
+# ---------------------------------------------------------------------------
+# _KeywordSet — agrees with a per-keyword regex reference
+# ---------------------------------------------------------------------------
+
+
+def _reference_match(keyword: str, text: str) -> bool:
+    """Word-boundary regex for single words, substring for phrases."""
+    if " " in keyword:
+        return keyword in text
+    return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
+
+
+class TestKeywordSet:
+    def test_hits_match_reference(self):
+        keywords = ["data", "api", "power bi", "sql"]
+        text = "candidate apis; power bi/sql-first data_lake (data)"
+        words = set(_WORD_RE.findall(text))
+        expected = {kw for kw in keywords if _reference_match(kw, text)}
+        assert _KeywordSet.of(keywords).hits(text, words) == expected
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("c++ developer, ci/cd and front-end work", {"c++", "ci/cd", "front-end"}),
+            ("(c++), ci/cd.", {"c++", "ci/cd"}),
+            ("objective-c++x, xci/cd, front-ender", set()),
+            ("c and cd and front end", set()),
+        ],
+        ids=["spaced", "bracketed", "glued-to-words", "pieces-only"],
+    )
+    def test_punctuated_keywords(self, text, expected):
+        keywords = ["c++", "ci/cd", "front-end"]
+        words = set(_WORD_RE.findall(text))
+        assert _KeywordSet.of(keywords).hits(text, words) == expected
+
+    def test_keyword_in_title_and_description_counts_once(self):
+        p = _posting(title="Python Intern", description="python daily")
+        assert score_track(p, Track.SWE) == 3